@@ -0,0 +1,153 @@
+"""Arama iptalinin gecikmesini ölçer.
+
+Her senaryoda bir FileSearch ayrı bir iş parçacığında başlatılır, kısa bir
+süre sonra stop() çağrılır ve iş parçacığının (işçi süreçler kapanıp arama
+kilidi bırakılana kadar) bitmesi için geçen süre ölçülür:
+
+- büyük dosyalarda içerik araması (işçi süreçler okuma ortasında)
+- tek bir kalabalık dizinin soğuk listelenmesi
+- derin bir ağacın soğuk gezinmesi
+- yeni aramanın öncekini geçersiz kılması: ikinci arama, ilki bitmeden
+  diske erişmemelidir
+
+Gecikme CANCEL_LATENCY_LIMIT'i aşarsa veya iki arama aynı anda disk okursa
+çıkış kodu 1 olur.
+
+Kullanım: python benchmarks/bench_cancel.py [ölçek]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_CACHE = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+os.environ['XDG_CACHE_HOME'] = BENCH_CACHE  # Kullanıcının dizin önbelleğine dokunma
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import searcher  # noqa: E402
+
+CANCEL_LATENCY_LIMIT = 1.0  # sn; işçi süreç başlatma süresini de kapsar
+
+
+class TimedSearch(searcher.FileSearch):
+    """Diskte ilk dizinin arandığı ve aramanın bittiği anları kaydeder"""
+    first_io = None
+    ended = None
+
+    def search_dir(self, *args):
+        if self.first_io is None:
+            self.first_io = time.perf_counter()
+        super().search_dir(*args)
+
+    def batches(self):
+        try:
+            yield from super().batches()
+        finally:
+            self.ended = time.perf_counter()
+
+
+def start(search):
+    thread = threading.Thread(target=lambda: sum(1 for _ in search.batches()), daemon=True)
+    thread.start()
+    return thread
+
+
+def measure_stop(search, delay):
+    thread = start(search)
+    time.sleep(delay)
+    stopped = time.perf_counter()
+    search.stop()
+    thread.join()
+    return time.perf_counter() - stopped
+
+
+def build_large_files(root, count):
+    """İşçi havuzunun açılması için CHUNK_SIZE'dan fazla büyük metin dosyası"""
+    line = b'lorem ipsum dolor sit amet consectetur adipiscing elit\n'
+    block = line * (4 * 1024 * 1024 // len(line))
+    for i in range(count):
+        with open(os.path.join(root, f'large{i:03d}.txt'), 'wb') as f:
+            f.write(block)
+
+
+def build_crowded_dir(root, count):
+    for i in range(count):
+        open(os.path.join(root, f'entry{i:07d}'), 'w').close()
+
+
+def build_deep_tree(root, depth, files_per_dir):
+    path = root
+    for level in range(depth):
+        for f in range(files_per_dir):
+            open(os.path.join(path, f'file{f:04d}'), 'w').close()
+        for branch in range(2):
+            os.makedirs(os.path.join(path, f'b{branch}'), exist_ok=True)
+        path = os.path.join(path, 'b0')
+
+
+def drop_index_cache():
+    shutil.rmtree(os.path.join(BENCH_CACHE, 'searcher'), ignore_errors=True)
+    searcher._file_indexes.clear()
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    failures = []
+    base = tempfile.mkdtemp(prefix='searcher-bench-')
+    try:
+        large_dir = os.path.join(base, 'large')
+        crowded_dir = os.path.join(base, 'crowded')
+        deep_dir = os.path.join(base, 'deep')
+        for path in (large_dir, crowded_dir, deep_dir):
+            os.mkdir(path)
+        print('Ağaçlar kuruluyor...')
+        build_large_files(large_dir, 3 * searcher.CHUNK_SIZE * scale)
+        build_crowded_dir(crowded_dir, 300000 * scale)
+        build_deep_tree(deep_dir, 200, 500 * scale)
+
+        scenarios = (
+            ('içerik (büyük dosyalar)', large_dir, True, 1.0),
+            ('kalabalık dizin (soğuk)', crowded_dir, False, 0.05),
+            ('derin ağaç (soğuk)', deep_dir, False, 0.1),
+        )
+        for label, root, content, delay in scenarios:
+            drop_index_cache()
+            search = TimedSearch('bulunmayan-sorgu', content, [root])
+            latency = measure_stop(search, delay)
+            mark = '' if latency <= CANCEL_LATENCY_LIMIT else '  (sınır aşıldı)'
+            if mark:
+                failures.append(label)
+            print(f'{label:>26}: iptal gecikmesi {latency * 1000:.1f} ms{mark}')
+
+        # Önceki aramayı geçersiz kılma: ikinci arama kilidi ancak ilki bitince alır
+        drop_index_cache()
+        first = TimedSearch('bulunmayan-sorgu', True, [large_dir])
+        second = TimedSearch('bulunmayan-sorgu-2', False, [deep_dir])
+        first_thread = start(first)
+        time.sleep(1.0)
+        superseded = time.perf_counter()
+        first.stop()
+        second_thread = start(second)
+        first_thread.join()
+        second_thread.join()
+        overlap = second.first_io is not None and second.first_io < first.ended
+        print(f"{'yeni arama öncekini kesti':>26}: önceki {(first.ended - superseded) * 1000:.1f} ms'de bitti, "
+              f"yeni arama {(second.first_io - superseded) * 1000:.1f} ms'de diske erişti"
+              f"{'  (aramalar çakıştı)' if overlap else ''}")
+        if overlap or first.ended - superseded > CANCEL_LATENCY_LIMIT:
+            failures.append('yeni arama')
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+        shutil.rmtree(BENCH_CACHE, ignore_errors=True)
+
+    if failures:
+        print(f"Başarısız: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
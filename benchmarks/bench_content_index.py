@@ -0,0 +1,102 @@
+"""İçerik dizininin içerik aramasına etkisini ölçer.
+
+Sentetik metin dosyalarından oluşan bir ağaçta aynı içerik araması dizinsiz
+ve ContentIndex ile çalıştırılır. Dizinin ilk kurulma süresi, dosyaların
+%1'i değiştikten sonraki artımlı güncelleme süresi ve her aramada okunmak
+üzere kuyruğa alınan dosya sayısı da raporlanır.
+
+Kullanım: python benchmarks/bench_content_index.py [dosya sayısı]   (varsayılan 20.000)
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_CACHE = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+os.environ['XDG_CACHE_HOME'] = BENCH_CACHE  # Kullanıcının dizin önbelleğine dokunma
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import searcher  # noqa: E402
+
+FILES_PER_DIR = 500
+WORDS = [f'kelime{i}' for i in range(5000)]
+QUERY = 'iğneçuvalda'
+
+
+class CountingSearch(searcher.FileSearch):
+    """Okunmak üzere kuyruğa alınan dosyaları sayar"""
+    queued = 0
+
+    def content_job(self):
+        self.queued += len(self.content_batch)
+        return super().content_job()
+
+
+def build_tree(root, file_count, rng):
+    paths = []
+    for i in range(file_count):
+        dir_path = os.path.join(root, f'd{i // FILES_PER_DIR:03d}')
+        os.makedirs(dir_path, exist_ok=True)
+        path = os.path.join(dir_path, f'file{i:06d}.txt')
+        words = rng.choices(WORDS, k=600)
+        if i % 100 == 7:
+            words[rng.randrange(len(words))] = QUERY.upper()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(' '.join(words))
+        paths.append(path)
+    return paths
+
+
+def update_index(content_index, paths):
+    start = time.perf_counter()
+    updated = sum(1 for path in paths if content_index.update(path))
+    return time.perf_counter() - start, updated
+
+
+def search(root, content_index, pool):
+    searcher._result_cache.clear()
+    search = CountingSearch(QUERY, True, [root], pool=pool, content_index=content_index)
+    start = time.perf_counter()
+    matches = sum(1 for _ in search)
+    return time.perf_counter() - start, matches, search.queued
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(23)
+    root = tempfile.mkdtemp(prefix='searcher-bench-')
+    pool = searcher.WorkerPool()
+    try:
+        print(f'{file_count} dosyalık ağaç kuruluyor...')
+        paths = build_tree(root, file_count, rng)
+        content_index = searcher.ContentIndex(root)
+        content_index.loaded = True
+
+        elapsed, updated = update_index(content_index, paths)
+        print(f'{"dizin kurulumu":>18}: {elapsed:.3f} sn, {updated} dosya, {len(content_index.postings)} kelime')
+
+        pool.warm()
+        search(root, None, pool)  # Sayfa önbelleğini ve işçileri ısıt
+        for label, index in (('dizinsiz', None), ('dizinli', content_index)):
+            elapsed, matches, queued = search(root, index, pool)
+            print(f'{label:>18}: {elapsed:.3f} sn, {matches} eşleşme, {queued} dosya okundu')
+
+        time.sleep(0.01)  # mtime_ns değişsin
+        for path in rng.sample(paths, max(file_count // 100, 1)):
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(f' {QUERY}')
+        elapsed, matches, queued = search(root, content_index, pool)
+        print(f'{"dizinli (%1 eski)":>18}: {elapsed:.3f} sn, {matches} eşleşme, {queued} dosya okundu')
+        elapsed, updated = update_index(content_index, paths)
+        print(f'{"artımlı güncelleme":>18}: {elapsed:.3f} sn, {updated} dosya yeniden okundu')
+    finally:
+        pool.shutdown()
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(BENCH_CACHE, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""İçerik aramasında dosya başına yapılan G/Ç çağrılarını ölçer.
+
+Eski akış (getsize + is_binary_file + metin kipinde ikinci açılış) ile tek
+açılışlı search_in_file karşılaştırılır. open/stat ailesi çağrıları os ve
+io fonksiyonları sarmalanarak, read sistem çağrıları Linux'ta
+/proc/self/io içindeki syscr sayacından okunarak sayılır.
+
+Kullanım: python benchmarks/bench_content_io.py [dosya sayısı]
+"""
+import builtins
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import searcher  # noqa: E402
+
+COUNTED = {
+    'os': ['stat', 'open', 'fstat', 'read', 'close'],
+    'io': ['open'],
+}
+
+
+def is_binary_file(file_path):
+    """Değişiklik öncesi binary kontrolü: ilk 1024 baytı ayrı bir açılışla okur"""
+    try:
+        with open(file_path, 'rb') as f:
+            return b'\0' in f.read(1024)
+    except OSError:
+        return True
+
+
+def legacy_search_in_file(file_path, search_query):
+    """Değişiklik öncesi içerik arama akışı"""
+    try:
+        if os.path.getsize(file_path) > searcher.MAX_FILE_SIZE:
+            return None
+        if is_binary_file(file_path):
+            return None
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read().lower()
+            if search_query.lower() in content:
+                return file_path
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def current_search_in_file(file_path, search_query):
+    return searcher.search_in_file((file_path, search_query))
+
+
+def build_files(root, count):
+    paths = []
+    for i in range(count):
+        path = os.path.join(root, f'file{i:05d}.txt')
+        with open(path, 'wb') as f:
+            if i % 10 == 0:
+                f.write(b'\0binary' * 100)
+            else:
+                f.write((f'line {i} lorem ipsum dolor sit amet\n' * 50).encode())
+                if i % 25 == 1:
+                    f.write(b'NEEDLE\n')
+        paths.append(path)
+    return paths
+
+
+def read_syscalls():
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('syscr:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def measure(func, paths, query):
+    syscr_before = read_syscalls()
+    counts = {}
+    originals = []
+    for module_name, names in COUNTED.items():
+        module = os if module_name == 'os' else io
+        for name in names:
+            original = getattr(module, name)
+            key = f'{module_name}.{name}'
+            counts[key] = 0
+
+            def wrapper(*args, __original=original, __key=key, **kwargs):
+                counts[__key] += 1
+                return __original(*args, **kwargs)
+
+            setattr(module, name, wrapper)
+            originals.append((module, name, original))
+    builtins_open = builtins.open
+    builtins.open = io.open  # open() io.open ile aynı nesnedir, sarmalanmışı kullan
+
+    start = time.perf_counter()
+    try:
+        matches = sum(1 for path in paths if func(path, query))
+    finally:
+        elapsed = time.perf_counter() - start
+        builtins.open = builtins_open
+        for module, name, original in originals:
+            setattr(module, name, original)
+    syscr_after = read_syscalls()
+
+    if syscr_before is not None:
+        counts['read syscall'] = syscr_after - syscr_before
+    return elapsed, matches, counts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory(prefix='searcher-bench-') as root:
+        paths = build_files(root, count)
+        for label, func in (('eski', legacy_search_in_file), ('tek açılış', current_search_in_file)):
+            elapsed, matches, counts = measure(func, paths, 'needle')
+            per_file = ', '.join(f'{key}={value / count:.2f}' for key, value in counts.items() if value)
+            print(f'{label:>10}: {elapsed:.3f} sn, {matches} eşleşme; dosya başına {per_file}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Bağlama noktası keşfinin ve yanıt vermeyen bağlamaların maliyetini ölçer.
+
+- get_mounted_paths(): önbellekli MountTable ile eski yöntemin (her aramada
+  psutil.disk_partitions(all=True) ve /mnt, /media, /run/media listesi)
+  çağrı başına süresi
+- yanıt vermeyen ağ bağlaması: bir dizini hiç dönmeyen sahte ağ aygıtıyla
+  yerel bir ağaç birlikte gezilir; gezinmenin SLOW_MOUNT_TIMEOUT civarında
+  bitmesi ve yerel sonuçların eksiksiz gelmesi beklenir
+
+Kullanım: python benchmarks/bench_mounts.py [çağrı sayısı]   (varsayılan 200)
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil  # noqa: E402
+import searcher  # noqa: E402
+
+HUNG_TIMEOUT = 1.0  # Ölçümde kullanılan süre sınırı (sn)
+
+
+def legacy_mounted_paths():
+    """Önceki get_mounted_paths(): her çağrıda tüm bağlamaları yeniden okur"""
+    mounted_paths = set()
+    for partition in psutil.disk_partitions(all=True):
+        if partition.mountpoint == '/' or partition.mountpoint == searcher.HOME_DIR:
+            continue
+        if any(mount in partition.mountpoint for mount in searcher.MOUNT_PATHS):
+            if os.path.exists(partition.mountpoint):
+                mounted_paths.add(partition.mountpoint)
+        elif 'sd' in partition.device or 'nvme' in partition.device:
+            if os.path.exists(partition.mountpoint):
+                mounted_paths.add(partition.mountpoint)
+    for mount_point in searcher.MOUNT_PATHS:
+        if os.path.exists(mount_point):
+            try:
+                for item in os.listdir(mount_point):
+                    full_path = os.path.join(mount_point, item)
+                    if os.path.ismount(full_path):
+                        mounted_paths.add(full_path)
+            except PermissionError:
+                continue
+    return mounted_paths
+
+
+def time_calls(function, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def hung_walk():
+    """Bir ağ dizini hiç yanıt vermezken yerel dizinlerin gezilme süresi"""
+    release = threading.Event()
+    tree = {'yerel': [f'yerel/{i}' for i in range(200)], 'ağ': ['ağ/takılan', 'ağ/1', 'ağ/2']}
+
+    def visit(path):
+        if path == 'ağ/takılan':
+            release.wait()  # Yanıt vermeyen NFS sunucusu
+        return path, tree.get(path, [])
+
+    searcher.SLOW_MOUNT_TIMEOUT = HUNG_TIMEOUT
+    walker = searcher.ParallelWalker(visit, 4, None, {'nas': searcher.MOUNT_NETWORK})
+    start = time.perf_counter()
+    visited = sum(1 for _ in walker.walk([(os.stat('/').st_dev, 'yerel'), ('nas', 'ağ')]))
+    elapsed = time.perf_counter() - start
+    release.set()
+    return elapsed, visited, len(tree['yerel']) + 1
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    searcher.get_mounted_paths()  # Tabloyu bir kez yükle
+    print(f'{len(searcher._mount_table.mounts)} bağlama, arama kökleri: {searcher.get_mounted_paths()}')
+    for label, function in (('eski yöntem', legacy_mounted_paths), ('MountTable', searcher.get_mounted_paths)):
+        print(f'{label:>14}: çağrı başına {time_calls(function, calls) * 1e6:,.0f} µs')
+
+    elapsed, visited, local = hung_walk()
+    mark = '' if elapsed < HUNG_TIMEOUT * 2 else '  (süre sınırı aşıldı)'
+    print(f'{"takılan ağ":>14}: {elapsed:.2f} sn, {visited} dizin ({local} yerel){mark}')
+    return 1 if mark else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
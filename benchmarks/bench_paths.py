@@ -0,0 +1,116 @@
+"""Dizin ve sonuç kayıtlarının girdi başına bellek kullanımını ölçer.
+
+Sentetik bir ağaç FileIndex ile taranır ve tracemalloc ile ölçülen kalıcı
+bellek girdi sayısına bölünür. Aynı kayıtlar eski biçimde (dizin başına ad
+listeleri) yeniden kurularak karşılaştırılır; TrigramIndex ve ağaçtaki tüm
+girdilerin ResultList'e eklenmesi, tam yol dizgeleri listesiyle birlikte
+raporlanır. Son sütun 5 milyon girdilik bir ağaç için tahmindir.
+
+Kullanım: python benchmarks/bench_paths.py [dosya sayısı]   (varsayılan 200.000)
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+BENCH_CACHE = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+os.environ['XDG_CACHE_HOME'] = BENCH_CACHE  # Kullanıcının dizin önbelleğine dokunma
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import searcher  # noqa: E402
+
+FILES_PER_DIR = 15
+PROJECTED_ENTRIES = 5_000_000
+STEMS = ['report', 'main', 'index', 'README', 'config', 'test_utils', 'IMG', 'notes', 'data', 'module']
+EXTENSIONS = ['.py', '.txt', '.jpg', '.md', '.json', '.c', '.html', '']
+
+
+def build_tree(root, file_count, rng):
+    """Her dizinde FILES_PER_DIR dosya bulunan ikili bir dizin ağacı kurar"""
+    dirs = [root]
+    for d in range(1, max(file_count // FILES_PER_DIR, 1)):
+        path = os.path.join(dirs[(d - 1) // 2], f'{rng.choice(STEMS).lower()}{d % 2}')
+        os.mkdir(path)
+        dirs.append(path)
+    for f in range(file_count):
+        name = f'{rng.choice(STEMS)}_{f}{rng.choice(EXTENSIONS)}'
+        open(os.path.join(dirs[f % len(dirs)], name), 'w').close()
+
+
+def measure(build):
+    """build() sonucunun kalıcı olarak tuttuğu belleği döndürür"""
+    tracemalloc.start()
+    value = build()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, retained
+
+
+def legacy_records(file_index):
+    """Ad listeli eski kayıt biçimi: (mtime, alt dizinler, bağlı dizinler, dosyalar)"""
+    return {path: (mtime, searcher.unpack_names(subdirs), searcher.unpack_names(linked),
+                   searcher.unpack_names(files))
+            for path, (mtime, subdirs, linked, files) in file_index.dirs.items()}
+
+
+def build_trigrams(file_index):
+    trigrams = searcher.TrigramIndex()
+    for path, record in file_index.iter_records():
+        trigrams.add_dir(path, record, *searcher.record_entries(record))
+    return trigrams
+
+
+def build_results(file_index, container):
+    for path, record in file_index.iter_records():
+        dirs, files = searcher.record_entries(record)
+        for name in dirs:
+            container.append(os.path.join(path, name), True)
+        for name in files:
+            container.append(os.path.join(path, name), False)
+    return container
+
+
+class PathList(list):
+    """Karşılaştırma için tam yol ve is_dir çiftlerinin düz listesi"""
+
+    def append(self, path, is_dir):
+        super().append((path, is_dir))
+
+
+def report(label, retained, entries):
+    per_entry = retained / entries
+    print(f'{label:>26}: {per_entry:6.1f} B/girdi, '
+          f'5M girdi için ~{per_entry * PROJECTED_ENTRIES / 2 ** 20:,.0f} MB')
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    root = tempfile.mkdtemp(prefix='searcher-bench-')
+    try:
+        print(f'{file_count} dosyalık ağaç kuruluyor...')
+        build_tree(root, file_count, random.Random(24))
+
+        def refresh():
+            file_index = searcher.FileIndex(root)
+            for _ in file_index.refresh():
+                pass
+            return file_index
+
+        file_index, retained = measure(refresh)
+        entries = sum(len(dirs) + len(files) for _, dirs, files in file_index.iter_dirs())
+        print(f'{entries} girdi, {len(file_index.dirs)} dizin')
+        report('FileIndex (eski listeler)', measure(lambda: legacy_records(file_index))[1], entries)
+        report('FileIndex', retained, entries)
+        report('TrigramIndex', measure(lambda: build_trigrams(file_index))[1], entries)
+        report('sonuçlar (tam yollar)', measure(lambda: build_results(file_index, PathList()))[1], entries)
+        report('ResultList', measure(lambda: build_results(file_index, searcher.ResultList()))[1], entries)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(BENCH_CACHE, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
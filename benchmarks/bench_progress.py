@@ -0,0 +1,85 @@
+"""İlerleme sinyali seyreltmesinin tarama süresine etkisini ölçer.
+
+Geçici bir dizinde sentetik bir ağaç oluşturur ve SearchWorker'ı gerçek bir
+QThread içinde, ilerleme sinyallerini ana iş parçacığında alarak çalıştırır.
+Seyreltilmiş raporlama, her öğe için bir sinyal gönderen eski davranışla
+karşılaştırılır.
+
+Kullanım: python benchmarks/bench_progress.py [dizin sayısı] [dizin başına dosya]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+BENCH_CACHE = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+os.environ['XDG_CACHE_HOME'] = BENCH_CACHE  # Kullanıcının dizin önbelleğine dokunma
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication  # noqa: E402
+import searcher  # noqa: E402
+
+
+class EveryEntrySearch(searcher.FileSearch):
+    """Eski davranış: taranan her öğe için bir ilerleme bildirimi"""
+
+    last_processed = 0
+
+    def report_progress(self, processed_items, total_items):
+        for item in range(self.last_processed + 1, processed_items + 1):
+            self.progress_callback(int((item / total_items) * 100))
+        self.last_processed = processed_items
+
+
+class EveryEntryWorker(searcher.SearchWorker):
+    def __init__(self, search_query):
+        super().__init__(search_query)
+        self.search = EveryEntrySearch(search_query, progress_callback=self.progress.emit)
+
+
+def build_tree(root, dir_count, files_per_dir):
+    for d in range(dir_count):
+        dir_path = os.path.join(root, f'dir{d:05d}')
+        os.makedirs(dir_path)
+        for f in range(files_per_dir):
+            open(os.path.join(dir_path, f'file{f:04d}.txt'), 'w').close()
+
+
+def run_worker(app, worker_class, query):
+    searcher._result_cache.clear()  # Tekrarlanan sorgu önbellekten yanıtlanmasın
+    worker = worker_class(query)
+    received = [0]
+    worker.progress.connect(lambda value: received.__setitem__(0, received[0] + 1))
+    worker.finished.connect(app.quit)
+    start = time.perf_counter()
+    worker.start()
+    app.exec_()
+    worker.wait()
+    return time.perf_counter() - start, received[0]
+
+
+def main():
+    dir_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    files_per_dir = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    app = QCoreApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory(prefix='searcher-bench-') as root:
+        build_tree(root, dir_count, files_per_dir)
+        searcher.HOME_DIR = root
+        total = dir_count * (files_per_dir + 1)
+        print(f'{total} öğe, {dir_count} dizin')
+
+        run_worker(app, searcher.SearchWorker, 'isinmaturu')  # Dizin önbelleğini ısıt
+        for label, worker_class in (('her öğede sinyal', EveryEntryWorker),
+                                    ('seyreltilmiş', searcher.SearchWorker)):
+            elapsed, signals = run_worker(app, worker_class, 'bulunmayan-ad')
+            print(f'{label:>18}: {elapsed:.3f} sn, {signals} ilerleme sinyali, '
+                  f'{total / elapsed:,.0f} öğe/sn')
+    shutil.rmtree(BENCH_CACHE, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
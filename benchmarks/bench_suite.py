@@ -0,0 +1,339 @@
+"""Sentetik dizin ağaçları üzerinde tekrarlanabilir arama ölçümleri.
+
+Geçici bir dizinde farklı biçimlerde ağaçlar kurulur (derin, geniş, çok
+sayıda küçük dosya, MAX_FILE_SIZE sınırına yakın büyük metin dosyaları,
+binary dosyalar ve SKIP_DIRS gürültüsü) ve her ağaçta ad araması, içerik
+araması ve uzantı filtreli içerik araması FileSearch çekirdeğiyle ölçülür.
+
+Her durum ayrı bir süreçte ve boş bir dizin önbelleğiyle çalışır; önce
+soğuk (dizin yok), sonra sıcak (dizin bellekte) arama yapılır. Raporlanan
+değerler: dosya/sn, ilk sonuca kadar geçen süre, tepe RSS (ana süreç ve
+içerik işçileri) ve /proc/<pid>/io üzerinden okuma/yazma sistem çağrısı
+sayıları. Ağaçlar sabit tohumla üretildiğinden sonuçlar karşılaştırılabilir.
+
+Kullanım:
+    python benchmarks/bench_suite.py [--scale N] [--json sonuc.json] [--compare onceki.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED = 1234
+NAME_QUERY = 'match'
+CONTENT_QUERY = 'needle'
+EXTENSION = 'py'
+WORDS = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'arama', 'dosya', 'dizin', 'içerik', 'örnek']
+REGRESSION_THRESHOLD = 0.10  # Karşılaştırmada bu orandan fazla yavaşlama işaretlenir
+REGRESSION_MIN_SECONDS = 0.005  # Bundan küçük farklar ölçüm gürültüsü sayılır
+
+
+def text_line(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(12)) + '\n'
+
+
+def write_text(path, rng, line_count, needle=False):
+    lines = [text_line(rng) for _ in range(line_count)]
+    if needle:
+        lines.insert(rng.randrange(len(lines) + 1), f'satır {CONTENT_QUERY.upper()} burada\n')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def file_name(rng, index):
+    """Dosyaların ~%2'si ad sorgusuyla eşleşir, ~%20'si .py uzantılıdır"""
+    stem = f'{NAME_QUERY}_{index}' if index % 50 == 0 else f'file_{index}'
+    return stem + ('.py' if rng.random() < 0.2 else '.txt')
+
+
+def build_deep(root, rng, scale):
+    """Her seviyede birkaç dosya bulunan 2 dallı, 10 seviyeli ağaç"""
+    count = 0
+    levels = [root]
+    for depth in range(10):
+        next_levels = []
+        for path in levels:
+            for f in range(max(scale // 400, 1)):
+                write_text(os.path.join(path, file_name(rng, count)), rng, 3, needle=count % 40 == 0)
+                count += 1
+            for branch in range(2):
+                sub = os.path.join(path, f'd{depth}_{branch}')
+                os.mkdir(sub)
+                next_levels.append(sub)
+        levels = next_levels
+
+
+def build_wide(root, rng, scale):
+    """Tek seviyede çok sayıda alt dizin ve tek bir kalabalık dizin"""
+    count = 0
+    for d in range(max(scale // 20, 1)):
+        sub = os.path.join(root, f'dir{d:05d}')
+        os.mkdir(sub)
+        for f in range(10):
+            write_text(os.path.join(sub, file_name(rng, count)), rng, 3, needle=count % 40 == 0)
+            count += 1
+    crowded = os.path.join(root, 'crowded')
+    os.mkdir(crowded)
+    for f in range(scale // 2):
+        write_text(os.path.join(crowded, file_name(rng, count)), rng, 1, needle=count % 40 == 0)
+        count += 1
+
+
+def build_tiny(root, rng, scale):
+    """Çok sayıda birkaç baytlık dosya"""
+    for d in range(max(scale // 1000, 1)):
+        sub = os.path.join(root, f'tiny{d:03d}')
+        os.mkdir(sub)
+        for f in range(1000):
+            index = d * 1000 + f
+            with open(os.path.join(sub, file_name(rng, index)), 'w') as out:
+                out.write(CONTENT_QUERY if index % 40 == 0 else 'x')
+
+
+def build_large(root, rng, scale, max_file_size):
+    """MAX_FILE_SIZE sınırının hemen altında ve üstünde büyük metin dosyaları"""
+    line = text_line(rng).encode()
+    for index in range(max(scale // 2500, 2)):
+        size = max_file_size - 4096 if index % 4 else max_file_size + 4096
+        with open(os.path.join(root, file_name(rng, index)), 'wb') as out:
+            out.write(line * (size // len(line)))
+            if index % 2:
+                out.write(f'{CONTENT_QUERY}\n'.encode())  # Eşleşme dosyanın sonunda
+
+
+def build_binary(root, rng, scale):
+    """NUL baytı içeren binary dosyalar; bazıları sorguyu da içerir"""
+    for index in range(max(scale // 10, 1)):
+        data = bytes(rng.getrandbits(8) for _ in range(2048)) + b'\0'
+        if index % 10 == 0:
+            data += CONTENT_QUERY.encode()
+        with open(os.path.join(root, file_name(rng, index)), 'wb') as out:
+            out.write(data)
+
+
+def build_skip_noise(root, rng, scale, skip_dirs):
+    """Atlanması gereken dizinlerde çok sayıda dosya, dışında az sayıda dosya"""
+    for project in range(max(scale // 2000, 1)):
+        project_dir = os.path.join(root, f'project{project}')
+        for skip_name in sorted(skip_dirs):
+            skip_dir = os.path.join(project_dir, skip_name)
+            os.makedirs(skip_dir)
+            for f in range(200):
+                write_text(os.path.join(skip_dir, file_name(rng, f)), rng, 1, needle=True)
+        for f in range(20):
+            write_text(os.path.join(project_dir, file_name(rng, f)), rng, 2, needle=f % 5 == 0)
+
+
+def build_trees(base, scale):
+    import searcher
+    rng = random.Random(SEED)
+    builders = (
+        ('deep', lambda root: build_deep(root, rng, scale)),
+        ('wide', lambda root: build_wide(root, rng, scale)),
+        ('tiny', lambda root: build_tiny(root, rng, scale)),
+        ('large', lambda root: build_large(root, rng, scale, searcher.MAX_FILE_SIZE)),
+        ('binary', lambda root: build_binary(root, rng, scale)),
+        ('skip_noise', lambda root: build_skip_noise(root, rng, scale, searcher.SKIP_DIRS)),
+    )
+    trees = {}
+    for name, build in builders:
+        root = os.path.join(base, name)
+        os.mkdir(root)
+        build(root)
+        trees[name] = root
+    return trees
+
+
+def count_entries(root, skip_dirs):
+    """Aramanın gezdiği öğe sayısı (SKIP_DIRS hariç)"""
+    total = 0
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        total += len(dirs) + len(files)
+    return total
+
+
+def read_io(pid='self'):
+    """/proc/<pid>/io içindeki okuma/yazma sistem çağrısı sayaçları"""
+    counters = {}
+    try:
+        with open(f'/proc/{pid}/io') as f:
+            for line in f:
+                key, value = line.split(':')
+                counters[key] = int(value)
+    except OSError:
+        return None
+    return counters.get('syscr', 0), counters.get('syscw', 0)
+
+
+def read_peak_rss(pid):
+    """Sürecin tepe RSS değeri (KB)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_case(spec):
+    """Alt süreçte tek bir durumu soğuk ve sıcak olarak ölçer"""
+    sys.path.insert(0, REPO_DIR)
+    import searcher
+
+    class MeasuredSearch(searcher.FileSearch):
+        """İçerik işçilerinin sayaçlarını havuz kapanmadan okur"""
+        worker_stats = None
+
+        def finish_content_search(self):
+            yield from super().finish_content_search()
+            executor = self.pool.executors.get(searcher.POOL_CONTENT)
+            if executor is not None:
+                pids = list(executor._processes)
+                io = [read_io(pid) or (0, 0) for pid in pids]
+                self.worker_stats = {
+                    'workers': len(pids),
+                    'read_syscalls': sum(reads for reads, _ in io),
+                    'write_syscalls': sum(writes for _, writes in io),
+                    'peak_rss_kb': max((read_peak_rss(pid) for pid in pids), default=0),
+                }
+
+    runs = {}
+    for phase in ('cold', 'warm'):
+        searcher._result_cache.clear()  # Sıcak arama önbellekten yanıtlanmasın
+        search = MeasuredSearch(spec['query'], spec['content'], [spec['root']], spec['ext'])
+        io_before = read_io()
+        first_result = None
+        start = time.perf_counter()
+        for batch in search.batches():
+            if first_result is None:
+                first_result = time.perf_counter() - start
+        elapsed = time.perf_counter() - start
+        io_after = read_io()
+
+        run = {
+            'seconds': round(elapsed, 6),
+            'files_per_second': round(spec['entries'] / elapsed, 1) if elapsed else None,
+            'time_to_first_result': round(first_result, 6) if first_result is not None else None,
+            'results': search.result_count,
+        }
+        if io_before and io_after:
+            run['read_syscalls'] = io_after[0] - io_before[0]
+            run['write_syscalls'] = io_after[1] - io_before[1]
+        if search.worker_stats:
+            run['content_workers'] = search.worker_stats
+        runs[phase] = run
+
+    runs['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return runs
+
+
+def run_case_process(spec):
+    """Durumu boş bir dizin önbelleğiyle ayrı bir süreçte çalıştırır"""
+    cache_dir = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+    try:
+        env = dict(os.environ, XDG_CACHE_HOME=cache_dir)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-case', json.dumps(spec)],
+                                env=env, check=True, stdout=subprocess.PIPE, text=True).stdout
+        return json.loads(output.splitlines()[-1])
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def compare(previous, current):
+    """Aynı durumların sıcak/soğuk sürelerini karşılaştırır, gerilemeleri listeler"""
+    old_cases = {case['name']: case for case in previous['cases']}
+    regressions = []
+    print('\nKarşılaştırma (süre değişimi, + yavaşlama):')
+    for case in current['cases']:
+        old = old_cases.get(case['name'])
+        if old is None:
+            continue
+        for phase in ('cold', 'warm'):
+            before, after = old[phase]['seconds'], case[phase]['seconds']
+            change = (after - before) / before if before else 0.0
+            mark = ' !' if change > REGRESSION_THRESHOLD and after - before > REGRESSION_MIN_SECONDS else ''
+            if mark:
+                regressions.append(f"{case['name']}/{phase}")
+            print(f"  {case['name']:>24} {phase}: {before:.3f} -> {after:.3f} sn ({change:+.1%}){mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Searcher arama ölçümleri')
+    parser.add_argument('--scale', type=int, default=20000, help='ağaç başına yaklaşık dosya sayısı')
+    parser.add_argument('--json', metavar='DOSYA', help='sonuçları JSON olarak yaz')
+    parser.add_argument('--compare', metavar='DOSYA', help='önceki JSON çıktısıyla karşılaştır')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return 0
+
+    sys.path.insert(0, REPO_DIR)
+    import searcher
+
+    base = tempfile.mkdtemp(prefix='searcher-bench-')
+    try:
+        print(f'Ağaçlar kuruluyor (ölçek {args.scale})...')
+        trees = build_trees(base, args.scale)
+        modes = (
+            ('name', NAME_QUERY, False, None),
+            ('content', CONTENT_QUERY, True, None),
+            ('content_ext', CONTENT_QUERY, True, EXTENSION),
+        )
+        cases = []
+        for tree, root in trees.items():
+            entries = count_entries(root, searcher.SKIP_DIRS)
+            for mode, query, content, ext in modes:
+                spec = {'root': root, 'query': query, 'content': content, 'ext': ext, 'entries': entries}
+                result = run_case_process(spec)
+                case = {'name': f'{tree}/{mode}', 'tree': tree, 'mode': mode, 'entries': entries, **result}
+                cases.append(case)
+                cold, warm = case['cold'], case['warm']
+                first = cold['time_to_first_result']
+                print(f"{case['name']:>24}: soğuk {cold['seconds']:.3f} sn ({cold['files_per_second'] or 0:,.0f} dosya/sn), "
+                      f"sıcak {warm['seconds']:.3f} sn, ilk sonuç {first if first is not None else '-'} sn, "
+                      f"{cold['results']} sonuç, tepe RSS {case['peak_rss_kb'] // 1024} MB, "
+                      f"okuma çağrısı {cold.get('read_syscalls', '-')}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'scale': args.scale,
+            'seed': SEED,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'cases': cases,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f'\nSonuçlar {args.json} dosyasına yazıldı')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(json.load(f), report)
+        if regressions:
+            print(f"\n{REGRESSION_THRESHOLD:.0%} üzerinde yavaşlama: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
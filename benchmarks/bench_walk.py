@@ -0,0 +1,125 @@
+"""Dizin gezinme yöntemlerini sentetik bir ağaç üzerinde karşılaştırır.
+
+Eski os.walk döngüsü (her dosya için os.path.join), FileIndex.list_dir'in
+kullandığı scan_entries ile düz gezinme (tam yol yalnızca eşleşmede
+kurulur), aynı gezinmenin DirEntry.stat() ile boyut/mtime okuyan hali,
+FileIndex yenilemesi ve ParallelWalker ile yenileme (soğuk ve sıcak) aynı
+ad aramasıyla ölçülür.
+
+Kullanım: python benchmarks/bench_walk.py [dosya sayısı]   (varsayılan 1.000.000)
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_CACHE = tempfile.mkdtemp(prefix='searcher-bench-cache-')
+os.environ['XDG_CACHE_HOME'] = BENCH_CACHE  # Kullanıcının dizin önbelleğine dokunma
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import searcher  # noqa: E402
+
+FILES_PER_DIR = 1000
+QUERY = 'file0042'
+
+
+def build_tree(root, file_count):
+    """10'ar alt dizinli, üç seviyeli ve yaprak başına 1000 dosyalı bir ağaç kurar"""
+    dir_count = max(file_count // FILES_PER_DIR, 1)
+    for d in range(dir_count):
+        dir_path = os.path.join(root, f'a{d // 100}', f'b{d // 10 % 10}', f'c{d % 10}')
+        os.makedirs(dir_path)
+        for f in range(min(FILES_PER_DIR, file_count)):
+            open(os.path.join(dir_path, f'file{f:04d}.txt'), 'w').close()
+        os.makedirs(os.path.join(dir_path, 'node_modules'))  # SKIP_DIRS gürültüsü
+
+
+def walk_legacy(root):
+    matches = 0
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in searcher.SKIP_DIRS]
+        for name in files:
+            full_path = os.path.join(current, name)
+            if QUERY in name.lower():
+                matches += 1
+    return matches
+
+
+def walk_scandir(root, with_stat=False):
+    """Dizinleri PathTable'da tutarak scan_entries ile gezer"""
+    table = searcher.PathTable()
+    stack = [(table.add(-1, root), root)]
+    matches = 0
+    while stack:
+        dir_id, dir_path = stack.pop()
+        for entry, kind in searcher.scan_entries(dir_path):
+            if with_stat:
+                try:
+                    entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass
+            if QUERY in entry.name.lower():
+                table.path(dir_id, entry.name)
+                matches += 1
+            if kind == searcher.ENTRY_DIR:
+                stack.append((table.add(dir_id, entry.name), entry.path))
+    return matches
+
+
+def walk_index(root):
+    matches = 0
+    for current, dirs, files in searcher.FileIndex(root).refresh():
+        for name in files:
+            if QUERY in name.lower():
+                os.path.join(current, name)
+                matches += 1
+    return matches
+
+
+def walk_index_parallel(root):
+    matches = 0
+    for file_index, current, dirs, files in searcher.refresh_indexes([searcher.FileIndex(root)]):
+        for name in files:
+            if QUERY in name.lower():
+                os.path.join(current, name)
+                matches += 1
+    return matches
+
+
+def drop_index_cache():
+    shutil.rmtree(os.path.join(BENCH_CACHE, 'searcher'), ignore_errors=True)
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    root = tempfile.mkdtemp(prefix='searcher-bench-')
+    try:
+        print(f'{file_count} dosyalık ağaç kuruluyor...')
+        build_tree(root, file_count)
+        walk_legacy(root)  # Sayfa önbelleğini ısıt
+
+        cases = (
+            ('os.walk + join', walk_legacy),
+            ('scan_entries', walk_scandir),
+            ('scan_entries + stat', lambda path: walk_scandir(path, with_stat=True)),
+            ('FileIndex soğuk', walk_index),
+            ('FileIndex sıcak', walk_index),
+            ('paralel soğuk', walk_index_parallel),
+            ('paralel sıcak', walk_index_parallel),
+        )
+        for label, func in cases:
+            if 'soğuk' in label:
+                drop_index_cache()
+            start = time.perf_counter()
+            matches = func(root)
+            elapsed = time.perf_counter() - start
+            print(f'{label:>19}: {elapsed:.3f} sn, {file_count / elapsed:,.0f} dosya/sn, {matches} eşleşme')
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(BENCH_CACHE, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
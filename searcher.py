@@ -1,17 +1,45 @@
 import sys
+import argparse
 import os
 import subprocess
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QListWidget, QMessageBox, QHBoxLayout, QCheckBox, QComboBox, QDialog,
-    QProgressBar, QListWidgetItem
+    QListView, QMessageBox, QHBoxLayout, QCheckBox, QComboBox, QDialog,
+    QProgressBar
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QAbstractListModel, QModelIndex
 from PyQt5.QtGui import QPixmap, QIcon
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from functools import lru_cache
 import mmap
+import zipfile
+import signal
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures.process import BrokenProcessPool
+import re
+import fnmatch
+import shlex
+import codecs
+import stat
+import json
+import pickle
+import hashlib
+import threading
+import select
+import struct
+import errno
+import time
+import ctypes
+import ctypes.util
+from array import array
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+from collections import deque, OrderedDict
+import queue
 import psutil  # En üste ekleyin
 
 def get_resource_path(filename):
@@ -33,195 +61,2814 @@ HOME_DIR = os.path.expanduser('~')
 SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', '.env'}
 MAX_WORKERS = min(multiprocessing.cpu_count(), 4)
 CHUNK_SIZE = 100
+# Qt iş parçacıkları varken fork güvenli değil, işçi süreçleri temiz başlat
+MP_CONTEXT = multiprocessing.get_context('spawn')
+RESULT_BATCH_SIZE = 500  # Arayüze tek seferde gönderilecek en fazla sonuç
+RESULT_BATCH_INTERVAL = 0.1  # Bekleyen sonuçların arayüze gönderilme aralığı (sn)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+CONTENT_CHUNK_SIZE = 1024 * 1024  # İçerik aramasında tek seferde okunan bayt
+BINARY_SNIFF_SIZE = 1024  # Binary kontrolü için bakılan ilk bayt sayısı
+SMALL_FILE_SIZE = 64 * 1024  # Bu boyuttaki dosyalar tek okumayla taranır
+QUERY_TEXT = 'text'  # Düz alt dize araması
+QUERY_REGEX = 'regex'  # Düzenli ifade (re)
+QUERY_GLOB = 'glob'  # Kabuk deseni (fnmatch); adın tamamıyla eşleşir
+QUERY_MODES = (QUERY_TEXT, QUERY_REGEX, QUERY_GLOB)
+# Arayüzde ve komut satırında (--ext code) seçilebilen uzantı kümeleri
+EXTENSION_SETS = {
+    'documents': frozenset({'doc', 'docx', 'odt', 'pdf', 'rtf', 'txt', 'md'}),
+    'spreadsheets': frozenset({'xls', 'xlsx', 'ods', 'csv'}),
+    'presentations': frozenset({'ppt', 'pptx', 'odp'}),
+    'code': frozenset({'py', 'js', 'ts', 'c', 'h', 'cpp', 'hpp', 'java', 'php', 'go', 'rs', 'rb',
+                       'sh', 'bat', 'sql'}),
+    'web': frozenset({'html', 'htm', 'css', 'xml', 'json'}),
+    'images': frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'svg', 'webp'}),
+    'archives': frozenset({'zip', 'tar', 'gz', 'bz2', 'xz', '7z', 'rar'}),
+}
+EXTENSION_SET_LABELS = {
+    'documents': 'Belgeler', 'spreadsheets': 'Tablolar', 'presentations': 'Sunumlar',
+    'code': 'Kod', 'web': 'Web', 'images': 'Resimler', 'archives': 'Arşivler',
+}
+QUERY_FIELDS = ('name', 'ext', 'size', 'content')  # Birleşik sorgularda alan:değer önekleri
+SIZE_UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4}
+SIZE_FILTER = re.compile(r'(<=|>=|<|>|=)?(\d+(?:\.\d+)?)([kmgt]?)b?', re.IGNORECASE)
+# Türkçe i/ı/İ/I farkını yok say; 'İ'.lower() sonucundaki birleşik noktayı at
+TURKISH_FOLD = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i', '\u0307': None})
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(HOME_DIR, '.cache'), 'searcher')
+TOTALS_FILE = os.path.join(CACHE_DIR, 'totals.json')  # Önceki taramaların öğe sayıları
+INDEX_DIR = os.path.join(CACHE_DIR, 'index')  # Arama köklerine ait dosya adı dizinleri
+WATCH_QUEUE_SIZE = 4096  # Bekleyen değişiklik sınırı, aşılırsa tam tarama yapılır
+WATCH_POLL_INTERVAL = 60  # inotify yoksa dizin mtime'larının yoklanma aralığı (sn)
+TRIGRAM_REBUILD_DIRS = 1000  # Trigram dizini bu kadar dizin değişince yeniden kurulur
+TRAVERSAL_WORKERS = 8  # Dizin gezinmesinde kullanılan iş parçacığı sayısı
+DEVICE_CONCURRENCY = 4  # Bir aygıtta aynı anda okunabilecek dizin sayısı
+ROTATIONAL_DEVICE_CONCURRENCY = 1  # Dönen disklerde kafa hareketini azaltmak için
+WALK_QUEUE_SIZE = 1024  # Gezinme sonuçları için kuyruk sınırı
+REFINE_MAX_AGE = 30  # Önceki sonuçların daraltma için kullanılabileceği süre (sn)
+RESULT_CACHE_MB = 64  # Son arama sonuçları önbelleğinin bellek bütçesi
+TEXT_CACHE_DIR = os.path.join(CACHE_DIR, 'text')  # Belgelerden çıkarılan metinler
+TEXT_CACHE_MB = 256  # Metin önbelleğinin disk bütçesi; aşılınca en uzun süredir kullanılmayanlar silinir
+MAX_DOCUMENT_SIZE = 50 * 1024 * 1024  # Metni çıkarılacak en büyük belge
+MAX_EXTRACTED_CHARS = MAX_FILE_SIZE  # Belge başına saklanan en fazla karakter
+EXTRACT_TIMEOUT = 10  # Tek bir belgenin metin çıkarma süresi sınırı (sn)
+EXTRACT_MEMORY_MB = 512  # Metin çıkarma işçisinin ek adres alanı sınırı
+DOCUMENT_CHUNK_SIZE = 4  # İşçiye tek seferde gönderilen belge sayısı
+POOL_CONTENT, POOL_DOCUMENTS = 'content', 'documents'  # WorkerPool havuz türleri
+CONTENT_TOKEN = re.compile(r'\w+')  # İçerik dizinindeki kelimeler (katlanmış metinde)
+CONTENT_TOKEN_MAX_LEN = 64  # Daha uzun kelimeler dizine yazılmaz, dosyaları her zaman aday sayılır
+CONTENT_INDEX_INTERVAL = 600  # İçerik dizinindeki dosyaların yeniden denetlenme aralığı (sn)
+MOUNT_INFO_PATH = '/proc/self/mountinfo'  # Değiştiğinde çekirdek poll() ile POLLPRI bildirir
+MOUNT_REFRESH_INTERVAL = 5  # mountinfo izlenemiyorsa bağlama tablosunun yenilenme aralığı (sn)
+MOUNT_ESCAPE = re.compile(r'\\([0-7]{3})')  # mountinfo yollarındaki \040 gibi sekizli kaçışlar
+# Bağlama türleri; get_mounted_paths() kökleri bu sırayla, hızlıdan yavaşa döndürür
+MOUNT_SSD = 'ssd'  # Dönmeyen yerel aygıt (SSD, NVMe) veya bellek (tmpfs)
+MOUNT_ROTATIONAL = 'rotational'
+MOUNT_FUSE = 'fuse'
+MOUNT_NETWORK = 'network'
+MOUNT_PSEUDO = 'pseudo'  # proc, sysfs gibi dosya içermeyen sistemler; hiç gezilmez
+MOUNT_KIND_ORDER = {MOUNT_SSD: 0, MOUNT_ROTATIONAL: 1, MOUNT_FUSE: 2, MOUNT_NETWORK: 3}
+SLOW_MOUNT_KINDS = frozenset({MOUNT_FUSE, MOUNT_NETWORK})  # Yanıt vermeyebilecek bağlamalar
+SLOW_MOUNT_CONCURRENCY = 2  # Ağ ve FUSE bağlamalarında aynı anda okunabilecek dizin sayısı
+SLOW_MOUNT_TIMEOUT = 10  # Ağ ve FUSE bağlamalarında tek dizin okumasının süre sınırı (sn)
+PSEUDO_FILESYSTEMS = frozenset({
+    'proc', 'sysfs', 'devtmpfs', 'devpts', 'devfs', 'cgroup', 'cgroup2', 'debugfs', 'tracefs',
+    'securityfs', 'pstore', 'bpf', 'configfs', 'fusectl', 'mqueue', 'hugetlbfs', 'binfmt_misc',
+    'efivarfs', 'rpc_pipefs', 'nsfs', 'selinuxfs', 'nfsd',
+})
+NETWORK_FILESYSTEMS = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ncpfs', 'afs', 'ceph', 'glusterfs', '9p', 'davfs',
+    'lustre', 'fuse.sshfs', 'fuse.rclone', 'fuse.s3fs', 'fuse.glusterfs', 'fuse.gvfsd-fuse',
+    'fuse.curlftpfs',
+    'autofs',  # Henüz tetiklenmemiş otomatik bağlama (çoğunlukla NFS); erişim bağlamayı bekletebilir
+})
+
+def unescape_mount_path(path):
+    return MOUNT_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), path)
+
+def parse_mountinfo(data):
+    """/proc/self/mountinfo içeriğini (bağlama noktası, aygıt numarası, kaynak, dosya sistemi) listesine çevirir"""
+    mounts = []
+    for line in os.fsdecode(data).splitlines():
+        # Alanlar: kimlik, üst kimlik, major:minor, kök, bağlama noktası, seçenekler,
+        # isteğe bağlı alanlar, '-', dosya sistemi, kaynak, süper blok seçenekleri
+        fields = line.split(' ')
+        try:
+            separator = fields.index('-', 6)
+            major, minor = fields[2].split(':')
+            mounts.append((unescape_mount_path(fields[4]), os.makedev(int(major), int(minor)),
+                           unescape_mount_path(fields[separator + 2]), fields[separator + 1]))
+        except (ValueError, IndexError):
+            continue
+    return mounts
+
+def classify_mount(fstype, device):
+    """Bağlamanın türünü dosya sistemine, yerel aygıtlarda dönen disk olup olmadığına göre belirler"""
+    if fstype in PSEUDO_FILESYSTEMS:
+        return MOUNT_PSEUDO
+    if fstype in NETWORK_FILESYSTEMS:
+        return MOUNT_NETWORK
+    # fuseblk (ntfs-3g, exfat) yerel bir blok aygıtı üzerindedir; diğer FUSE türleri bir sürece bağlıdır
+    if fstype.startswith('fuse') and fstype != 'fuseblk':
+        return MOUNT_FUSE
+    if device is None:
+        return MOUNT_SSD
+    return local_mount_kind(device)
+
+class MountTable:
+    """Sınıflandırılmış bağlama noktalarının önbelleği.
+
+    Linux'ta /proc/self/mountinfo açık tutulur ve yalnızca çekirdek bağlama
+    tablosunun değiştiğini poll() ile bildirdiğinde yeniden okunur. Diğer
+    sistemlerde psutil sonuçları MOUNT_REFRESH_INTERVAL boyunca kullanılır.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.mounts = []  # (bağlama noktası, aygıt numarası, kaynak, dosya sistemi, tür); uzun yol önce
+        self.pseudo_paths = frozenset()  # Gezinmede atlanan sözde dosya sistemi kökleri
+        self.info_file = None
+        self.poller = None
+        self.loaded_at = None
+
+    def refresh(self):
+        """Bağlama tablosu değiştiyse yeniden okur"""
+        with self.lock:
+            if self.loaded_at is None:
+                self.open_mountinfo()
+            elif self.poller is not None:
+                if not self.poller.poll(0):
+                    return
+            elif time.monotonic() - self.loaded_at < MOUNT_REFRESH_INTERVAL:
+                return
+            self.load()
+
+    def open_mountinfo(self):
+        try:
+            self.info_file = open(MOUNT_INFO_PATH, 'rb')
+            self.poller = select.poll()
+            self.poller.register(self.info_file, select.POLLPRI | select.POLLERR)
+        except (OSError, AttributeError):  # Linux dışı sistemler
+            if self.info_file is not None:
+                self.info_file.close()
+            self.info_file = self.poller = None
+
+    def load(self):
+        if self.info_file is not None:
+            # Aynı tanıtıcıdan okumak bekleyen değişiklik bildirimini sıfırlar
+            self.info_file.seek(0)
+            entries = parse_mountinfo(self.info_file.read())
+        else:
+            entries = [(partition.mountpoint, None, partition.device, partition.fstype)
+                       for partition in psutil.disk_partitions(all=True)]
+        # Aynı noktada birden çok bağlama varsa (ör. autofs üstüne bağlanmış NFS)
+        # en üstteki, yani listedeki son bağlama türü belirler
+        top = {mountpoint: (device, source, fstype) for mountpoint, device, source, fstype in entries}
+        mounts = [(mountpoint, device, source, fstype, classify_mount(fstype, device))
+                  for mountpoint, (device, source, fstype) in top.items()]
+        mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+        self.mounts = mounts
+        self.pseudo_paths = frozenset(mount[0] for mount in mounts if mount[4] == MOUNT_PSEUDO)
+        self.loaded_at = time.monotonic()
+
+    def kind_of(self, path):
+        """Yolun bulunduğu bağlamanın türü; bilinmiyorsa None"""
+        for mountpoint, _, _, _, kind in self.mounts:
+            if path == mountpoint or path.startswith(mountpoint.rstrip(os.sep) + os.sep):
+                return kind
+        return None
+
+    def nested_mounts(self, root):
+        """Kökün altındaki (sözde olmayan) bağlamaların (bağlama noktası, tür) listesi"""
+        prefix = root.rstrip(os.sep) + os.sep
+        return [(mountpoint, kind) for mountpoint, _, _, _, kind in self.mounts
+                if kind != MOUNT_PSEUDO and mountpoint.startswith(prefix)]
+
+    def search_roots(self):
+        """Harici disk ve bağlama köklerini hızlıdan yavaşa sıralı döndürür"""
+        roots = {}
+        for mountpoint, _, source, _, kind in self.mounts:
+            # Sistem diski, ev dizini ve sözde dosya sistemleri aranmaz
+            if kind == MOUNT_PSEUDO or mountpoint in ('/', HOME_DIR):
+                continue
+            # Harici diskler, USB'ler ve /dev/sd* veya /dev/nvme* disk bölümleri
+            if any(mountpoint == mount_path or mountpoint.startswith(mount_path + os.sep)
+                   for mount_path in MOUNT_PATHS) or \
+                    'sd' in source or 'nvme' in source:
+                roots[mountpoint] = kind
+        return sorted(roots, key=lambda mountpoint: (MOUNT_KIND_ORDER[roots[mountpoint]], mountpoint))
+
+_mount_table = MountTable()
 
 def get_mounted_paths():
-    """Bağlı disklerin yollarını döndürür"""
-    mounted_paths = set()
-    
-    # psutil ile bağlı diskleri al
-    partitions = psutil.disk_partitions(all=True)
-    
-    for partition in partitions:
+    """Bağlı disklerin yollarını döndürür; tablo yalnızca bağlamalar değişince yeniden okunur"""
+    _mount_table.refresh()
+    return _mount_table.search_roots()
+
+def parse_extensions(value):
+    """Uzantı seçimini frozenset'e çevirir.
+
+    value 'py', '.py', 'py,js', bir küme adı ('code') ya da bunların
+    listesi olabilir; boşsa None döner.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    extensions = set()
+    for item in value:
+        item = item.strip().lower().lstrip('.')
+        if item in EXTENSION_SETS:
+            extensions |= EXTENSION_SETS[item]
+        elif item:
+            extensions.add(item)
+    return frozenset(extensions) or None
+
+def file_extension(name):
+    """Adın son noktasından sonraki kısmı küçük harfle döndürür; '.bashrc' gibi adlarda ''"""
+    dot = name.rfind('.')
+    return name[dot + 1:].lower() if dot > 0 else ''
+
+def load_item_totals():
+    """Önceki taramalarda sayılan öğe sayılarını okur"""
+    try:
+        with open(TOTALS_FILE, 'r', encoding='utf-8') as f:
+            totals = json.load(f)
+        return totals if isinstance(totals, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_item_totals(totals):
+    """Tarama sonunda sayılan öğe sayılarını diske yazar"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = TOTALS_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(totals, f)
+        os.replace(tmp_path, TOTALS_FILE)
+    except OSError:
+        pass
+
+def estimate_item_count(path, totals):
+    """Bir arama yolundaki öğe sayısını tahmin eder.
+
+    Önceki taramanın sonucu varsa o kullanılır, yoksa dosya sisteminin
+    kullanılan inode sayısına (os.statvfs) başvurulur.
+    """
+    if path in totals:
+        return totals[path]
+    try:
+        st = os.statvfs(path)
+        return max(st.f_files - st.f_ffree, 0)
+    except (OSError, AttributeError):
+        return 0
+
+ENTRY_FILE, ENTRY_DIR, ENTRY_LINKED_DIR = range(3)  # scan_entries girdi türleri
+CANCEL_CHECK_ENTRIES = 4096  # Büyük dizinler listelenirken iptalin kontrol aralığı
+
+class SearchCancelled(Exception):
+    pass
+
+class CancelToken:
+    """Bir aramanın iptal jetonu.
+
+    Aramalar artan kuşak numaraları alır; iptal edilen en büyük kuşak,
+    işçi havuzu açılırken süreçlere aktarılan paylaşılan sayaçta (board)
+    tutulur. Böylece uzun ömürlü işçiler her işte yalnızca kuşak numarasını
+    alarak iptali görür. Aramalar sırayla çalıştığından bir kuşağın iptali
+    öncekileri de iptal eder. Çalışan iş parçacığının jetonu
+    _cancel_state'te durur.
+    """
+
+    def __init__(self, board=None, generation=1):
+        self.board = board if board is not None else MP_CONTEXT.RawValue('q', 0)
+        self.generation = generation
+
+    def cancel(self):
+        with _cancel_lock:
+            if self.board.value < self.generation:
+                self.board.value = self.generation
+
+    @property
+    def cancelled(self):
+        return self.board.value >= self.generation
+
+_cancel_state = threading.local()
+_cancel_lock = threading.Lock()
+
+def set_cancel_token(token):
+    """Jetonu çalışan iş parçacığına (veya işçi sürece) bağlar"""
+    _cancel_state.token = token
+
+def check_cancelled():
+    """Çalışan iş parçacığının araması iptal edildiyse SearchCancelled verir"""
+    token = getattr(_cancel_state, 'token', None)
+    if token is not None and token.board.value >= token.generation:
+        raise SearchCancelled()
+
+def scan_entries(path):
+    """Bir dizinin girdilerini (DirEntry, tür) çiftleri olarak üretir.
+
+    Tür bilgisi DirEntry önbelleğinden (d_type) alınır, ek stat yapılmaz;
+    SKIP_DIRS'teki dizinler ve sözde dosya sistemi bağlamaları girdi
+    düzeyinde atlanır.
+    """
+    pseudo_paths = _mount_table.pseudo_paths
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield entry, ENTRY_FILE
+                elif entry.name in SKIP_DIRS or entry.path in pseudo_paths:
+                    continue
+                elif entry.is_symlink():
+                    yield entry, ENTRY_LINKED_DIR
+                else:
+                    yield entry, ENTRY_DIR
+    except OSError:
+        pass
+
+class PathTable:
+    """Her dizini bir kez (üst dizin numarası, ad) olarak saklayan yol tablosu.
+
+    Kayıtlar (dizin numarası, ad) çiftleriyle tutulur; ortak dizin önekleri
+    tekrar saklanmaz ve tam yol yalnızca path() ile istendiğinde kurulur.
+    Kök dizinlerin üst numarası -1'dir ve adları tam yollarıdır.
+    """
+
+    def __init__(self):
+        self.parents = array('i')  # dizin numarası -> üst dizin numarası
+        self.names = []  # dizin numarası -> ad
+        self.children = {}  # (üst numara, ad) -> numara; intern() ile eklenenler için
+        # Son eklenen dizinin kökten itibaren (yol, numara) zinciri; ardışık kayıtlar
+        # çoğunlukla aynı dizinden veya onun bir kardeşinden gelir
+        self.chain = []
+        self.chain_depths = {}  # yol -> zincirdeki derinlik
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self):
+        return self.parents, self.names, self.children
+
+    def __setstate__(self, state):
+        self.parents, self.names, self.children = state
+        self.chain = []
+        self.chain_depths = {}
+
+    def add(self, parent_id, name):
+        """Dizini denetlemeden ekler; gezinmede her dizin zaten bir kez görülür"""
+        self.parents.append(parent_id)
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def intern(self, path, create=True):
+        """Dizinin numarasını döndürür; yoksa üst dizinleriyle ekler (create=False ise None)"""
+        chain, depths = self.chain, self.chain_depths
+        # Zincirdeki en derin ortak ata bulunana kadar yukarı çık
+        missing = []
+        ancestor = path
+        while ancestor not in depths:
+            parent, name = os.path.split(ancestor)
+            if not name:
+                break
+            missing.append((ancestor, name))
+            ancestor = parent
+        depth = depths.get(ancestor)
+        if depth is None:
+            depth = -1
+            missing.append((ancestor, None))  # Kök dizin veya göreli yolun başı
+        for stale_path, _ in chain[depth + 1:]:
+            del depths[stale_path]
+        del chain[depth + 1:]
+
+        dir_id = chain[depth][1] if depth >= 0 else -1
+        for dir_path, name in reversed(missing):
+            key = (dir_id, name) if name is not None else (-1, dir_path)
+            dir_id = self.children.get(key)
+            if dir_id is None:
+                if not create:
+                    return None
+                dir_id = self.children[key] = self.add(*key)
+            depths[dir_path] = len(chain)
+            chain.append((dir_path, dir_id))
+        return dir_id
+
+    def find(self, path):
+        """intern(path, create=False) gibidir ancak zinciri değiştirmez; kilitsiz okumalar içindir"""
+        dir_id = self.children.get((-1, path))
+        parent, name = os.path.split(path)
+        if dir_id is not None or not name:
+            return dir_id
+        parent_id = self.find(parent)
+        return self.children.get((parent_id, name)) if parent_id is not None else None
+
+    def dir_path(self, dir_id):
+        parts = []
+        while dir_id >= 0:
+            parts.append(self.names[dir_id])
+            dir_id = self.parents[dir_id]
+        return os.path.join(*reversed(parts))
+
+    def path(self, dir_id, name):
+        return os.path.join(self.dir_path(dir_id), name)
+
+class ResultList:
+    """(yol, is_dir) sonuçlarını dizinlerini PathTable'da paylaşarak tutar.
+
+    Her sonuç için dizin numarası, ad ve is_dir baytı saklanır; tam yol
+    yalnızca görüntülenen veya teslim edilen satırlar için kurulur.
+    """
+    DIR_SIZE = 160  # Yeni bir dizinin tabloda kapladığı yaklaşık bayt (ad ve sözlük girdisi)
+
+    def __init__(self):
+        self.table = PathTable()
+        self.dir_ids = array('I')
+        self.names = []
+        self.is_dir = bytearray()
+        self.size = 0  # Yaklaşık bellek kullanımı (bayt)
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, path, is_dir):
+        dir_count = len(self.table)
+        parent, name = os.path.split(path)
+        self.dir_ids.append(self.table.intern(parent))
+        self.names.append(name)
+        self.is_dir.append(is_dir)
+        # Ad işaretçisi, dizin numarası ve is_dir baytı
+        self.size += sys.getsizeof(name) + 13 + (len(self.table) - dir_count) * self.DIR_SIZE
+
+    def path(self, item):
+        return self.table.path(self.dir_ids[item], self.names[item])
+
+    def __iter__(self):
+        """(yol, is_dir) çiftlerini verir; dizin yolu her dizin için bir kez kurulur"""
+        last_id, dir_path = -1, None
+        for dir_id, name, is_dir in zip(self.dir_ids, self.names, self.is_dir):
+            if dir_id != last_id:
+                last_id, dir_path = dir_id, self.table.dir_path(dir_id)
+            yield os.path.join(dir_path, name), bool(is_dir)
+
+def unpack_names(packed):
+    """'\0' ile birleştirilmiş ad listesini açar"""
+    return packed.split('\0') if packed else []
+
+def record_entries(record):
+    """FileIndex kaydının (alt dizinler ve bağlı dizinler, dosyalar) ad listeleri"""
+    _, subdirs, linked_dirs, files = record
+    return unpack_names(subdirs) + unpack_names(linked_dirs), unpack_names(files)
+
+class FileIndex:
+    """Bir arama kökü için diskte saklanan dosya adı dizini.
+
+    Her dizin yolu bir kez anahtar olarak tutulur; kaydı (mtime_ns, alt
+    dizinler, bağlı dizinler, dosyalar) olup ad listeleri '\0' ile
+    birleştirilmiş tek dizgelerdir. Böylece girdi başına ayrı bir str nesnesi
+    saklanmaz; listeler record_entries() ile gerektiğinde açılır. Yenileme
+    sırasında yalnızca mtime'ı değişen dizinler yeniden listelenir.
+    """
+    VERSION = 2
+
+    def __init__(self, root):
+        self.root = root
+        self.dirs = {}  # dizin yolu -> (mtime_ns, alt dizinler, bağlı dizinler, dosyalar)
+        self.loaded = False
+        self.live = False  # IndexWatcher değişiklikleri anlık işliyorsa True
+        self.refreshing = False
+        self.refresh_lock = threading.Lock()
+        self.new_dirs = None  # Yenileme sırasında ziyaret edilen dizinler
+        self.refresh_changed = False
+        self.version = 0  # Tablo her değiştiğinde artar
+        self.trigrams = None  # Geçerli TrigramIndex
+        self.pending_trigrams = None  # Kurulmakta olan TrigramIndex
+
+    @property
+    def index_path(self):
+        digest = hashlib.sha1(self.root.encode('utf-8', 'surrogateescape')).hexdigest()
+        return os.path.join(INDEX_DIR, f'{digest}.idx')
+
+    def load(self):
+        """Dizini diskten okur, bozuk veya eski sürüm dosyaları yok sayar"""
+        self.loaded = True
         try:
-            # Sistem diski ve özel mount noktalarını atla
-            if partition.mountpoint == '/' or partition.mountpoint == HOME_DIR:
+            with open(self.index_path, 'rb') as f:
+                version, root, dirs = pickle.load(f)
+            if version == self.VERSION and root == self.root:
+                self.dirs = dirs
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            self.dirs = {}
+
+    def save(self):
+        """Dizini geçici dosya üzerinden atomik olarak diske yazar"""
+        try:
+            os.makedirs(INDEX_DIR, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((self.VERSION, self.root, self.dirs), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def list_dir(self, path):
+        """Bir dizini listeler: '\0' ile birleştirilmiş (alt dizinler, sembolik bağlı dizinler, dosyalar)"""
+        subdirs, linked_dirs, files = [], [], []
+        for count, (entry, kind) in enumerate(scan_entries(path), 1):
+            if count % CANCEL_CHECK_ENTRIES == 0:
+                check_cancelled()  # Kısmi liste kaydedilmez, eski kayıt korunur
+            if kind == ENTRY_DIR:
+                subdirs.append(entry.name)
+            elif kind == ENTRY_LINKED_DIR:
+                linked_dirs.append(entry.name)  # os.walk gibi içine girme
+            else:
+                files.append(entry.name)
+        return '\0'.join(subdirs), '\0'.join(linked_dirs), '\0'.join(files)
+
+    def begin_refresh(self, blocking=True):
+        """Yenilemeyi başlatır; aynı anda yalnızca bir yenileme yapılabilir.
+
+        blocking=False ise başka bir yenileme sürerken beklemeden False döner.
+        """
+        if not self.refresh_lock.acquire(blocking):
+            return False
+        if not self.loaded:
+            self.load()
+        self.new_dirs = {}
+        self.refresh_changed = False
+        self.refreshing = True
+        return True
+
+    def read_dir(self, path):
+        """Dizini tabloya yazmadan okur; başka bir yenileme sürerken aramalar için"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self.dirs.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached
+        return (mtime,) + self.list_dir(path)
+
+    def visit(self, path):
+        """Yenileme sırasında bir dizini ziyaret eder, kaydını döndürür.
+
+        mtime'ı değişmeyen dizinin listesi dizinden okunur; erişilemeyen
+        dizinlerde None döner. Birden çok iş parçacığından çağrılabilir.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self.refresh_changed = True
+            return None
+
+        cached = self.dirs.get(path)
+        if cached is not None and cached[0] == mtime:
+            record = cached
+        else:
+            record = (mtime,) + self.list_dir(path)
+            self.refresh_changed = True
+        self.new_dirs[path] = record
+        return record
+
+    def end_refresh(self, complete):
+        """Yenilemeyi bitirir; yarıda kesilen yenilemelerde görülen dizinler yine de saklanır"""
+        try:
+            changed = self.refresh_changed
+            if complete:
+                changed = changed or len(self.new_dirs) != len(self.dirs)
+                self.dirs = self.new_dirs
+            else:
+                self.dirs.update(self.new_dirs)
+            self.new_dirs = None
+            if changed:
+                self.version += 1
+                self.trigrams = None
+                self.save()
+        finally:
+            self.refreshing = False
+            self.refresh_lock.release()
+
+    def refresh(self, before_visit=None):
+        """Dizini sırayla yeniler ve her dizin için (yol, alt dizinler, dosyalar) üretir.
+
+        before_visit(yol) verilirse her dizin okunmadan önce çağrılır; False
+        döndürürse yenileme yarıda bırakılır.
+        """
+        self.begin_refresh()
+        complete = False
+        stack = [self.root]
+        try:
+            while stack:
+                path = stack.pop()
+                if before_visit is not None and not before_visit(path):
+                    return
+                record = self.visit(path)
+                if record is None:
+                    continue
+                dirs, files = record_entries(record)
+                yield path, dirs, files
+                stack.extend(os.path.join(path, d) for d in reversed(unpack_names(record[1])))
+            complete = True
+        finally:
+            self.end_refresh(complete)
+
+    def iter_dirs(self):
+        """Diske dokunmadan bellekteki tabloyu (yol, alt dizinler, dosyalar) olarak gezer"""
+        for path, record in self.iter_records():
+            dirs, files = record_entries(record)
+            yield path, dirs, files
+
+    def iter_records(self):
+        """Bellekteki tabloyu (yol, kayıt) olarak gezer"""
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            record = self.dirs.get(path)
+            if record is None:
                 continue
-                
-            # Sadece harici diskleri ve USB'leri ekle    
-            if any(mount in partition.mountpoint for mount in MOUNT_PATHS):
-                if os.path.exists(partition.mountpoint):
-                    mounted_paths.add(partition.mountpoint)
-                    
-            # /dev/sd* veya /dev/nvme* disk bölümlerini kontrol et        
-            elif ('sd' in partition.device or 'nvme' in partition.device):
-                if os.path.exists(partition.mountpoint):
-                    mounted_paths.add(partition.mountpoint)
-                    
-        except PermissionError:
+            yield path, record
+            stack.extend(os.path.join(path, d) for d in reversed(unpack_names(record[1])))
+
+    def update_dir(self, path):
+        """Tek bir dizini yeniden listeler, (eklenen, silinen) alt dizin yollarını döndürür"""
+        old = self.dirs.get(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self.drop_tree(path)
+            return [], []
+        record = (mtime,) + self.list_dir(path)
+        self.dirs[path] = record
+        self.mark_changed(path)
+        old_subdirs = set(unpack_names(old[1])) if old else set()
+        new_subdirs = set(unpack_names(record[1]))
+        added = [os.path.join(path, d) for d in new_subdirs - old_subdirs]
+        removed = [os.path.join(path, d) for d in old_subdirs - new_subdirs]
+        for sub_path in removed:
+            self.drop_tree(sub_path)
+        return added, removed
+
+    def drop_tree(self, path):
+        """Bir dizini ve altındaki tüm kayıtları tablodan çıkarır"""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            record = self.dirs.pop(current, None)
+            if record is not None:
+                self.mark_changed(current)
+                stack.extend(os.path.join(current, d) for d in unpack_names(record[1]))
+
+    def mark_changed(self, path):
+        """Değişen dizini trigram dizinlerine bildirir"""
+        self.version += 1
+        for trigrams in (self.trigrams, self.pending_trigrams):
+            if trigrams is not None:
+                trigrams.changed_dirs.add(path)
+
+    def start_trigrams(self):
+        """Tarama sırasında doldurulacak yeni bir TrigramIndex başlatır"""
+        self.pending_trigrams = TrigramIndex()
+        return self.pending_trigrams
+
+    def finish_trigrams(self, trigrams):
+        """Tamamlanan TrigramIndex'i geçerli dizin yapar"""
+        if self.pending_trigrams is trigrams:
+            self.trigrams = trigrams
+            self.pending_trigrams = None
+
+    def usable_trigrams(self):
+        """Canlı dizinde, çok fazla dizin değişmemişse geçerli TrigramIndex'i döndürür"""
+        trigrams = self.trigrams
+        if not self.live or trigrams is None or len(trigrams.changed_dirs) > TRIGRAM_REBUILD_DIRS:
+            return None
+        return trigrams
+
+class TrigramIndex:
+    """Küçük harfli dosya adları üzerinde trigram tabanlı alt dize dizini.
+
+    Her giriş (dizin numarası, dizindeki sıra) olarak array('I') içinde,
+    her trigramın giriş numaraları da array('I') içinde tutulur; adlar
+    saklanmaz, dizinin kurulduğu andaki FileIndex kaydından okunur. Sorgunun
+    en kısa posting listesindeki adaylar doğrudan doğrulanır; üç karakterden
+    kısa sorgularda tüm adlar taranır. Dizin kurulduktan sonra değişen
+    dizinler changed_dirs içinde toplanır, bunların girişleri atlanır ve
+    güncel listeleri FileIndex'ten okunur.
+    """
+
+    def __init__(self):
+        self.dir_paths = []  # dizin numarası -> dizin yolu
+        self.dir_records = []  # dizin numarası -> adların okunduğu FileIndex kaydı
+        self.entry_dirs = array('I')  # giriş -> dizin numarası
+        self.entry_positions = array('I')  # giriş -> alt dizinler ve dosyalar içindeki sıra
+        self.is_dir = bytearray()
+        self.postings = {}  # trigram -> array('I') giriş numaraları
+        self.changed_dirs = set()
+
+    def add_dir(self, dir_path, record, dirs, files):
+        """record_entries(record) ile açılmış bir dizinin girdilerini ekler"""
+        dir_id = len(self.dir_paths)
+        self.dir_paths.append(dir_path)
+        self.dir_records.append(record)
+        first = len(self.entry_dirs)
+        for position, name in enumerate(dirs + files):
+            self.entry_dirs.append(dir_id)
+            self.entry_positions.append(position)
+            self.is_dir.append(position < len(dirs))
+            lowered = name.lower()
+            for gram in {lowered[i:i + 3] for i in range(len(lowered) - 2)}:
+                postings = self.postings.get(gram)
+                if postings is None:
+                    postings = self.postings[gram] = array('I')
+                postings.append(first + position)
+
+    def candidates(self, query):
+        """Sorguyu içerebilecek giriş numaralarını döndürür"""
+        if len(query) < 3:
+            return range(len(self.entry_dirs))
+        shortest = None
+        for gram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            postings = self.postings.get(gram)
+            if postings is None:
+                return ()
+            if shortest is None or len(postings) < len(shortest):
+                shortest = postings
+        return shortest
+
+    def search(self, query, file_index):
+        """Küçük harfli sorguyu adında içeren (yol, is_dir) çiftlerini üretir"""
+        changed_dirs = set(self.changed_dirs)
+        names_dir, names = -1, None  # Adaylar dizin sırasıyla gelir, son açılan liste saklanır
+        for entry_id in self.candidates(query):
+            dir_id = self.entry_dirs[entry_id]
+            dir_path = self.dir_paths[dir_id]
+            if dir_path in changed_dirs:
+                continue
+            if dir_id != names_dir:
+                dirs, files = record_entries(self.dir_records[dir_id])
+                names_dir, names = dir_id, dirs + files
+            name = names[self.entry_positions[entry_id]]
+            if query in name.lower():
+                yield os.path.join(dir_path, name), bool(self.is_dir[entry_id])
+
+        # Dizin kurulduktan sonra değişen dizinleri güncel listeleriyle tara
+        for dir_path in changed_dirs:
+            record = file_index.dirs.get(dir_path)
+            if record is None:
+                continue
+            dirs, files = record_entries(record)
+            for dir_name in dirs:
+                if query in dir_name.lower():
+                    yield os.path.join(dir_path, dir_name), True
+            for name in files:
+                if query in name.lower():
+                    yield os.path.join(dir_path, name), False
+
+class ContentIndex:
+    """Bir kök altındaki metin dosyaları için diskte saklanan ters kelime dizini.
+
+    Her dosya bir numara alır ve katlanmış (fold_case) içeriğindeki her
+    kelime için dosya numaraları array('I') posting listelerinde tutulur.
+    Dosya kayıtları dizinleri PathTable'da paylaşılarak (dizin numarası, ad)
+    altında saklanır ve (boyut, mtime_ns, inode) ile anahtarlanır; değişen
+    dosya yeni numarayla yeniden okunur, eskisi ölü sayılır ve ölü numaralar
+    çoğalınca listeler sıkıştırılır. Dizin yalnızca kaydı güncel olan ve
+    sorgunun kelimelerini içermeyen dosyaları elemek için kullanılır;
+    adaylar yine diskte doğrulanır. Dizini değiştiren işlemler _search_lock
+    tutularak yapılır, böylece arama sürerken dizin değişmez.
+    """
+    VERSION = 2
+
+    def __init__(self, root):
+        self.root = root
+        self.table = PathTable()
+        # dizin numarası -> {ad: (numara, boyut, mtime_ns, inode)}; içeriği aranmayan dosyalarda numara -1
+        self.files = {}
+        self.live = bytearray()  # numara -> değişen veya silinen dosyalarda 0
+        self.postings = {}  # kelime -> array('I') dosya numaraları
+        self.long_token_files = set()  # CONTENT_TOKEN_MAX_LEN'den uzun kelime içeren dosyalar
+        self.dead = 0
+        self.seen_dirs = bytearray()  # dizin numarası -> son geçişte görüldüyse 1; saklanmaz
+        self.loaded = False  # Aramalar dizini yalnızca yüklendikten sonra kullanır
+        self.changed = False
+
+    @property
+    def index_path(self):
+        digest = hashlib.sha1(self.root.encode('utf-8', 'surrogateescape')).hexdigest()
+        return os.path.join(INDEX_DIR, f'{digest}.content')
+
+    def load(self):
+        """Dizini diskten okur, bozuk veya eski sürüm dosyaları yok sayar"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                version, root, *state = pickle.load(f)
+            if version == self.VERSION and root == self.root:
+                self.table, self.files, self.live, self.postings, self.long_token_files, self.dead = state
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            pass
+        self.loaded = True
+
+    def save(self):
+        """Dizini geçici dosya üzerinden atomik olarak diske yazar"""
+        try:
+            os.makedirs(INDEX_DIR, exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((self.VERSION, self.root, self.table, self.files, self.live, self.postings,
+                             self.long_token_files, self.dead), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.index_path)
+            self.changed = False
+        except OSError:
+            pass
+
+    def delete(self):
+        try:
+            os.remove(self.index_path)
+        except OSError:
+            pass
+
+    def record(self, path):
+        """Dosyanın kaydını döndürür, yoksa None"""
+        parent, name = os.path.split(path)
+        records = self.files.get(self.table.intern(parent, create=False))
+        return records.get(name) if records is not None else None
+
+    def lookup(self, path):
+        """Kaydı güncelse dosyanın numarasını (-1: içeriği aranmaz), değilse None döndürür"""
+        record = self.record(path)
+        if record is None:
+            return None
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        if (file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino) != record[1:]:
+            return None
+        return record[0]
+
+    def update(self, path):
+        """Kaydı eskiyse dosyanın kelimelerini yeniden okur; dizin değiştiyse True döner"""
+        return self.apply(path, self.read_changes(path, self.record(path)))
+
+    def dir_records(self, dir_path):
+        """Dizindeki {ad: kayıt} sözlüğünü PathTable zincirine dokunmadan döndürür.
+
+        Dizini değiştiren tek iş parçacığı (ContentIndexer) bunu _search_lock
+        olmadan çağırabilir.
+        """
+        dir_id = self.table.find(dir_path)
+        return self.files.get(dir_id, {}) if dir_id is not None else {}
+
+    def read_changes(self, path, record):
+        """Dosyanın kaydı (record) eskiyse dosyayı okur, güncelse None döndürür.
+
+        Dizini değiştirmez, _search_lock gerekmez; sonuç apply() ile yazılır.
+        Silinen dosyalar için (None, None) döner.
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return (None, None) if record is not None else None
+        key = (file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino)
+        if record is not None and record[1:] == key:
+            return None
+        # Okuma sırasında değişen dosyanın kaydı eski anahtarla kalır, sonraki denetimde yenilenir
+        return key, scan_file(path, read_tokens, skipped=None)
+
+    def apply(self, path, changes):
+        """read_changes() sonucunu dizine yazar; dizin değiştiyse True döner"""
+        if changes is None:
+            return False
+        key, tokens = changes
+        if key is None:
+            return self.remove(path)
+        self.remove(path)
+        parent, name = os.path.split(path)
+        records = self.files.setdefault(self.table.intern(parent), {})
+        if tokens is None:
+            records[name] = (-1,) + key
+        else:
+            file_id = len(self.live)
+            self.live.append(1)
+            records[name] = (file_id,) + key
+            for token in tokens:
+                if len(token) > CONTENT_TOKEN_MAX_LEN:
+                    self.long_token_files.add(file_id)
+                    continue
+                postings = self.postings.get(token)
+                if postings is None:
+                    postings = self.postings[token] = array('I')
+                postings.append(file_id)
+        self.changed = True
+        return True
+
+    def remove(self, path):
+        parent, name = os.path.split(path)
+        dir_id = self.table.intern(parent, create=False)
+        records = self.files.get(dir_id)
+        record = records.pop(name, None) if records is not None else None
+        if record is None:
+            return False
+        if not records:
+            del self.files[dir_id]
+        if record[0] >= 0:
+            self.live[record[0]] = 0
+            self.long_token_files.discard(record[0])
+            self.dead += 1
+        self.changed = True
+        return True
+
+    def begin_pass(self):
+        """Silinen dosyaları bulmak için dizinlerin görülme işaretlerini sıfırlar"""
+        self.seen_dirs = bytearray(len(self.table))
+
+    def mark_dir(self, dir_path, names):
+        """Dizinin names dışında kalan kayıtlarını siler ve dizini bu geçişte görülmüş sayar"""
+        dir_id = self.table.intern(dir_path, create=False)
+        records = self.files.get(dir_id) if dir_id is not None else None
+        if records is None:
+            return
+        for name in [name for name in records if name not in names]:
+            self.remove(os.path.join(dir_path, name))
+        if dir_id >= len(self.seen_dirs):
+            self.seen_dirs.extend(bytes(dir_id + 1 - len(self.seen_dirs)))
+        self.seen_dirs[dir_id] = 1
+
+    def remove_unseen(self):
+        """Geçişte görülmeyen dizinlerdeki kayıtları siler, gerekirse dizini sıkıştırır"""
+        seen = self.seen_dirs
+        for dir_id in [dir_id for dir_id in self.files if dir_id >= len(seen) or not seen[dir_id]]:
+            dir_path = self.table.dir_path(dir_id)
+            for name in list(self.files[dir_id]):
+                self.remove(os.path.join(dir_path, name))
+        if self.dead > len(self.live) // 2:
+            self.compact()
+
+    def compact(self):
+        """Ölü numaraları posting listelerinden atar ve numaraları yeniden verir"""
+        remap = {}
+        for old_id, live in enumerate(self.live):
+            if live:
+                remap[old_id] = len(remap)
+        postings = {}
+        for token, ids in self.postings.items():
+            kept = array('I', [remap[file_id] for file_id in ids if file_id in remap])
+            if kept:
+                postings[token] = kept
+        for records in self.files.values():
+            for name, record in records.items():
+                if record[0] >= 0:
+                    records[name] = (remap[record[0]],) + record[1:]
+        self.long_token_files = {remap[file_id] for file_id in self.long_token_files}
+        self.live = bytearray(b'\1') * len(remap)
+        self.postings, self.dead = postings, 0
+        self.changed = True
+
+    def candidates(self, terms):
+        """Terimlerin hepsini içerebilecek dosya numaralarını döndürür.
+
+        Terimin iç kelimeleri dizinde birebir, baştaki kelime bir kelimenin
+        sonu, sondaki kelime bir kelimenin başı olarak aranır; tek kelimelik
+        terim herhangi bir kelimenin içinde geçebilir. Kelime içermeyen
+        terimlerde dizin kullanılamaz ve None döner.
+        """
+        result = None
+        for term in terms:
+            folded = fold_case(term)
+            words = list(CONTENT_TOKEN.finditer(folded))
+            if not words:
+                return None
+            for match in words:
+                word = match.group()
+                open_start, open_end = match.start() == 0, match.end() == len(folded)
+                if not open_start and not open_end:
+                    ids = set(self.postings.get(word, ()))
+                else:
+                    ids = set()
+                    for token, postings in self.postings.items():
+                        if open_start and open_end:
+                            found = word in token
+                        elif open_start:
+                            found = token.endswith(word)
+                        else:
+                            found = token.startswith(word)
+                        if found:
+                            ids.update(postings)
+                ids |= self.long_token_files
+                result = ids if result is None else result & ids
+                if not result:
+                    return result
+        return result
+
+@lru_cache(maxsize=None)
+def local_mount_kind(device):
+    """Yerel aygıtın dönen disk olup olmadığını sysfs'ten okur"""
+    if not sys.platform.startswith('linux'):
+        return MOUNT_SSD
+    sys_path = f'/sys/dev/block/{os.major(device)}:{os.minor(device)}'
+    # Bölümlerde queue dizini üst aygıttadır
+    for rotational_path in (os.path.join(sys_path, 'queue', 'rotational'),
+                            os.path.join(sys_path, '..', 'queue', 'rotational')):
+        try:
+            with open(rotational_path, 'r') as f:
+                return MOUNT_ROTATIONAL if f.read().strip() == '1' else MOUNT_SSD
+        except OSError:
             continue
-            
-    # Eski yöntem ile destekle
-    for mount_point in MOUNT_PATHS:
-        if os.path.exists(mount_point):
+    return MOUNT_SSD
+
+def device_concurrency(device, kind=None):
+    """Aygıtta aynı anda okunabilecek dizin sayısını döndürür; dönen disklerde ve ağ bağlamalarında daha az"""
+    if kind is None:
+        kind = local_mount_kind(device)
+    if kind in SLOW_MOUNT_KINDS:
+        return SLOW_MOUNT_CONCURRENCY
+    if kind == MOUNT_ROTATIONAL:
+        return ROTATIONAL_DEVICE_CONCURRENCY
+    return DEVICE_CONCURRENCY
+
+def stat_with_timeout(path, timeout):
+    """os.stat'ı ayrı bir iş parçacığında süre sınırıyla çağırır; yanıt gelmezse veya hata olursa None"""
+    result = []
+
+    def target():
+        try:
+            result.append(os.stat(path))
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0] if result else None
+
+WALK_DONE = object()  # ParallelWalker işçisinin bittiğini bildirir
+
+class ParallelWalker:
+    """Dizin ağaçlarını iş çalan bir iş parçacığı havuzunda gezer.
+
+    Her iş parçacığı bulduğu alt dizinleri kendi deque'sunun sonuna ekleyip
+    oradan alır, işi bitince diğerlerinin kuyruk başından iş çalar. Dizin
+    okuma GIL'i bıraktığı için farklı disklerin ve büyük alt ağaçların
+    gecikmeleri örtüşür. Görevler (aygıt, veri) çiftleridir; aynı aygıtta
+    eşzamanlı okuma device_concurrency() ile sınırlanır. Ağ ve FUSE
+    aygıtlarında bir dizin SLOW_MOUNT_TIMEOUT içinde okunamazsa işçi
+    beklenmeden bırakılır ve o aygıtın kalan görevleri atlanır.
+    """
+
+    def __init__(self, visit, workers=TRAVERSAL_WORKERS, token=None, device_kinds=None):
+        self.visit = visit  # veri -> (sonuç veya None, [alt görev verileri])
+        self.token = token  # İş parçacıklarına aktarılan iptal jetonu
+        # aygıt -> bağlama türü; veri olarak anahtarı bulunan alt görev (iç içe
+        # bağlama noktası) kendi aygıtı sayılır
+        self.device_kinds = device_kinds or {}
+        self.workers = workers
+        self.deques = [deque() for _ in range(workers)]
+        self.results = queue.Queue(maxsize=WALK_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.outstanding = 0  # Kuyruklarda bekleyen ve işlenen görev sayısı
+        self.device_slots = {}
+        self.busy = {}  # işçi numarası -> (aygıt, son an); süre sınırlı aygıtlarda okuma sürerken
+        self.abandoned = set()  # Süre sınırını aştığı için beklenmeyen işçiler
+        self.timed_out_devices = set()
+        self.is_running = True
+        self.error = None
+
+    def stop(self):
+        self.is_running = False
+
+    def device_slot(self, device):
+        with self.lock:
+            slot = self.device_slots.get(device)
+            if slot is None:
+                slot = self.device_slots[device] = threading.BoundedSemaphore(
+                    device_concurrency(device, self.device_kinds.get(device)))
+        return slot
+
+    def abandon_stalled(self):
+        """Süre sınırını aşan işçileri bırakır, sayısını döndürür; aygıtlarının kalan görevleri atlanır"""
+        now = time.monotonic()
+        with self.lock:
+            stalled = [worker_id for worker_id, (_, deadline) in self.busy.items() if now > deadline]
+            for worker_id in stalled:
+                device, _ = self.busy.pop(worker_id)
+                self.abandoned.add(worker_id)
+                self.timed_out_devices.add(device)
+                self.outstanding -= 1
+        return len(stalled)
+
+    def take(self, worker_id):
+        """Önce kendi kuyruğunun sonundan, yoksa diğerlerinin başından görev alır"""
+        try:
+            return self.deques[worker_id].pop()
+        except IndexError:
+            pass
+        for offset in range(1, self.workers):
             try:
-                for item in os.listdir(mount_point):
-                    full_path = os.path.join(mount_point, item)
-                    if os.path.ismount(full_path):
-                        mounted_paths.add(full_path)
-            except PermissionError:
+                return self.deques[(worker_id + offset) % self.workers].popleft()
+            except IndexError:
                 continue
-                
-    return mounted_paths
+        return None
 
-# SearchWorker sınıfında güncelleme
-class SearchWorker(QThread):
-    """Arama işlemlerini arka planda yürüten worker sınıfı"""
-    finished = pyqtSignal(list)  # [(path, is_dir), ...]
-    error = pyqtSignal(str)
-    progress = pyqtSignal(int)  # Progress sinyali
-    status = pyqtSignal(str, str)  # (mesaj, renk) için yeni sinyal
+    def put(self, item):
+        while self.is_running:
+            try:
+                self.results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
 
-    def __init__(self, search_query, content_search=False, root_search=False, file_format=None):
-        super().__init__()
+    def work(self, worker_id):
+        own = self.deques[worker_id]
+        set_cancel_token(self.token)
+        try:
+            while self.is_running:
+                check_cancelled()
+                task = self.take(worker_id)
+                if task is None:
+                    with self.lock:
+                        if self.outstanding == 0:
+                            break
+                    time.sleep(0.005)
+                    continue
+
+                device, data = task
+                if device in self.timed_out_devices:
+                    with self.lock:
+                        self.outstanding -= 1  # Yanıt vermeyen bağlamanın kalan dizinleri
+                    continue
+                slot = self.device_slot(device)
+                if not slot.acquire(timeout=0.05):
+                    own.appendleft(task)  # Aygıt meşgul, başka bir göreve geç
+                    continue
+                timed = self.device_kinds.get(device) in SLOW_MOUNT_KINDS
+                if timed:
+                    with self.lock:
+                        self.busy[worker_id] = (device, time.monotonic() + SLOW_MOUNT_TIMEOUT)
+                try:
+                    result, children = self.visit(data)
+                finally:
+                    slot.release()
+                if timed:
+                    with self.lock:
+                        if worker_id in self.abandoned:
+                            return  # Ana döngü bu işçiyi bitmiş saydı
+                        del self.busy[worker_id]
+
+                # Alt görevler, bu görev düşülmeden önce sayılır ki sayaç erken sıfırlanmasın
+                if self.device_kinds:
+                    kinds = self.device_kinds
+                    own.extend((child if child in kinds else device, child) for child in children)
+                else:
+                    own.extend((device, child) for child in children)
+                with self.lock:
+                    self.outstanding += len(children) - 1
+                if result is not None:
+                    self.put(result)
+        except Exception as e:
+            self.error = e
+            self.is_running = False
+        finally:
+            with self.lock:
+                abandoned = worker_id in self.abandoned
+            if not abandoned:
+                self.put(WALK_DONE)
+
+    def walk(self, tasks):
+        """[(aygıt, veri), ...] görevlerinden başlayarak visit sonuçlarını bulundukça üretir"""
+        for i, task in enumerate(tasks):
+            self.deques[i % self.workers].append(task)
+        self.outstanding = len(tasks)
+        threads = [threading.Thread(target=self.work, args=(i,), daemon=True) for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        try:
+            while finished < self.workers:
+                try:
+                    item = self.results.get(timeout=0.1)
+                except queue.Empty:
+                    # Hata veya iptalle duran işçiler bitiş işaretini koyamamış olabilir
+                    if not self.is_running:
+                        break
+                    finished += self.abandon_stalled()
+                    continue
+                if item is WALK_DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            self.is_running = False
+            for worker_id, thread in enumerate(threads):
+                # Yanıt vermeyen bağlamada takılan işçi en çok süre sınırı kadar beklenir
+                with self.lock:
+                    busy = self.busy.get(worker_id)
+                if worker_id in self.abandoned:
+                    continue
+                thread.join(max(busy[1] - time.monotonic(), 0) if busy is not None else None)
+        if self.error is not None:
+            raise self.error
+
+def refresh_indexes(file_indexes, workers=TRAVERSAL_WORKERS):
+    """Dizinleri ParallelWalker ile birlikte yeniler.
+
+    Her dizin için (FileIndex, yol, alt dizinler, dosyalar) üretir; farklı
+    kökler ve büyük alt ağaçlar aynı anda gezilir. Kökler bağlama türüne
+    göre hızlıdan yavaşa sıralanır, sözde dosya sistemleri atlanır. Süre
+    sınırını aşan ağ bağlamalarının dizinleri tamamlanmamış sayılır ve
+    eski kayıtları korunur. Yenilemesi başka bir iş parçacığında (IndexWatcher)
+    sürmekte olan kök beklenmez, tabloya yazılmadan gezilir.
+    """
+    def visit(data):
+        file_index, path = data
+        if file_index in private:
+            record = file_index.read_dir(path)
+        else:
+            record = file_index.visit(path)
+        if record is None:
+            return None, ()
+        dirs, files = record_entries(record)
+        children = [(file_index, os.path.join(path, d)) for d in unpack_names(record[1])]
+        return (file_index, path, dirs, files), children
+
+    _mount_table.refresh()
+    roots = []
+    for file_index in file_indexes:
+        kind = _mount_table.kind_of(file_index.root)
+        if kind != MOUNT_PSEUDO:
+            roots.append((MOUNT_KIND_ORDER.get(kind, 0), kind, file_index))
+    roots.sort(key=lambda root: root[0])
+
+    tasks = []
+    started = []
+    private = set()
+    device_kinds = {}
+    walker = None
+    complete = False
+    try:
+        for _, kind, file_index in roots:
+            # Yanıt vermeyen ağ bağlamasının kökü aramayı bekletmesin
+            if kind in SLOW_MOUNT_KINDS:
+                root_stat = stat_with_timeout(file_index.root, SLOW_MOUNT_TIMEOUT)
+            else:
+                try:
+                    root_stat = os.stat(file_index.root)
+                except OSError:
+                    root_stat = None
+            if root_stat is None:
+                continue
+            device = root_stat.st_dev
+            if kind is not None:
+                device_kinds[device] = kind
+            # Kökün altındaki bağlamalar kendi eşzamanlılık ve süre sınırlarıyla gezilir
+            for mountpoint, nested_kind in _mount_table.nested_mounts(file_index.root):
+                device_kinds[(file_index, mountpoint)] = nested_kind
+            if file_index.begin_refresh(blocking=False):
+                started.append((file_index, device))
+            else:
+                private.add(file_index)
+            tasks.append((device, (file_index, file_index.root)))
+        if tasks:
+            # Çağıran iş parçacığının iptal jetonu gezinme iş parçacıklarına da geçer
+            token = getattr(_cancel_state, 'token', None)
+            walker = ParallelWalker(visit, workers, token, device_kinds)
+            yield from walker.walk(tasks)
+        complete = True
+    finally:
+        timed_out = walker.timed_out_devices if walker is not None else ()
+        for file_index, device in started:
+            partial = device in timed_out or any(isinstance(key, tuple) and key[0] is file_index
+                                                 for key in timed_out)
+            file_index.end_refresh(complete and not partial)
+
+class ResultCache:
+    """Son aramaların sonuçlarını bellek bütçesiyle sınırlı LRU düzeninde tutar.
+
+    Her kayıt, arama köklerinin FileIndex sürümleriyle saklanır; kökler
+    değiştiyse (dizin mtime'ları farklıysa) kayıt geçersiz sayılır. Yerinde
+    düzenlenen dosyalar sürümü değiştirmediğinden içeriğe veya boyuta bakan
+    aramalar saklanmaz.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # anahtar -> (sürümler, zaman, ResultList)
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, versions, results):
+        if results.size > self.budget_bytes:
+            return
+        with self.lock:
+            self.discard_locked(key)
+            self.entries[key] = (versions, time.monotonic(), results)
+            self.size += results.size
+            while self.size > self.budget_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted[2].size
+
+    def discard(self, key):
+        with self.lock:
+            self.discard_locked(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def discard_locked(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2].size
+
+_result_cache = ResultCache(RESULT_CACHE_MB * 1024 * 1024)
+_search_lock = threading.Lock()  # Disk okuyan tek arama
+_search_waiting = threading.Event()  # _search_lock'u bekleyen arama var; dizinleyici yol verir
+
+_file_indexes = {}
+
+def get_file_index(root):
+    """Arama kökü için bellekte tutulan dizini döndürür"""
+    index = _file_indexes.get(root)
+    if index is None:
+        index = _file_indexes[root] = FileIndex(root)
+    return index
+
+class WorkerPool:
+    """Aramalar arasında paylaşılan içerik ve belge işçi havuzları.
+
+    Havuzlar ilk kullanımda veya warm() ile önceden açılır ve kapatılana
+    kadar açık kalır; ardışık aramalar süreç başlatma ve modül yükleme
+    maliyetini yeniden ödemez. Çöken (BrokenProcessPool) havuz atılır ve
+    bir sonraki gönderimde yeniden kurulur. İşlere yalnızca aramanın iptal
+    kuşağı eklenir; iptal sayacı havuz açılırken işçilere aktarılır.
+    """
+
+    def __init__(self, workers=MAX_WORKERS):
+        self.workers = workers
+        self.board = MP_CONTEXT.RawValue('q', 0)  # İptal edilen en büyük kuşak
+        self.generation = 0
+        self.executors = {}  # Havuz türü -> ProcessPoolExecutor
+        self.lock = threading.Lock()
+
+    def new_token(self):
+        """Sonraki arama için yeni kuşaklı bir iptal jetonu"""
+        with self.lock:
+            self.generation += 1
+            return CancelToken(self.board, self.generation)
+
+    def executor(self, kind):
+        with self.lock:
+            executor = self.executors.get(kind)
+            if executor is None:
+                initializer = init_extraction_worker if kind == POOL_DOCUMENTS else init_content_worker
+                executor = self.executors[kind] = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=MP_CONTEXT,
+                    initializer=initializer, initargs=(self.board,))
+            return executor
+
+    def started(self, kind):
+        return kind in self.executors
+
+    def discard(self, kind, executor):
+        """Çöken havuzu bırakır; sonraki gönderimde yenisi açılır"""
+        with self.lock:
+            if self.executors.get(kind) is executor:
+                del self.executors[kind]
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, kind, token, function, *args):
+        """İşi jetonun kuşağıyla gönderir; havuz çökmüşse bir kez yeniden kurar"""
+        executor = self.executor(kind)
+        try:
+            return executor.submit(run_job, token.generation, function, *args)
+        except BrokenProcessPool:
+            self.discard(kind, executor)
+            return self.executor(kind).submit(run_job, token.generation, function, *args)
+
+    def warm(self, kind=POOL_CONTENT):
+        """Havuzu açıp tüm işçileri başlatır; çökmüş havuzu yeniler (sağlık denetimi)"""
+        started = self.started(kind)
+        executor = self.executor(kind)
+        try:
+            # Yeni havuzda tüm işçiler başlatılır; açık havuzda tek iş yeterli denetimdir
+            for _ in range(1 if started else self.workers):
+                executor.submit(os.getpid)
+        except BrokenProcessPool:
+            self.discard(kind, executor)
+            self.warm(kind)
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            executors, self.executors = list(self.executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+# inotify sabitleri (linux/inotify.h)
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+WATCH_MASK = (IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+              IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def load_inotify():
+    """libc içindeki inotify fonksiyonlarını ctypes ile yükler, yoksa None döndürür"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class IndexWatcher(threading.Thread):
+    """Bir FileIndex'i dosya sistemi olaylarıyla güncel tutan arka plan iş parçacığı.
+
+    inotify kullanılabiliyorsa oluşturma/silme/taşıma olaylarında yalnızca
+    ilgili dizin yeniden listelenir ve dizin "canlı" kabul edilir. inotify
+    yoksa veya izleme sınırı (fs.inotify.max_user_watches) dolarsa dizin
+    mtime'ları belirli aralıklarla yoklanır ve aramalar tam yenilemeye döner.
+    """
+
+    def __init__(self, index):
+        super().__init__(daemon=True)
+        self.index = index
+        self.is_running = True
+        self.libc = load_inotify()
+        self.fd = -1
+        self.watches = {}  # wd -> dizin yolu
+        self.pending = set()  # Yeniden listelenecek dizinler
+        self.needs_rescan = False
+        self.updated = False  # Son kayıttan beri olaylarla güncellenen dizin var mı
+
+    def stop(self):
+        self.is_running = False
+
+    def run(self):
+        try:
+            if self.libc is not None:
+                self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self.fd < 0 or not self.watch_all():
+                self.close_inotify()
+                self.poll_loop()
+                return
+            self.index.live = True
+            self.event_loop()
+        finally:
+            self.index.live = False
+            self.close_inotify()
+            if self.updated:
+                self.index.save()
+
+    def close_inotify(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.watches.clear()
+
+    def add_watch(self, path):
+        """Dizine izleme ekler; izleme sınırı dolduysa False döndürür"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            return ctypes.get_errno() != errno.ENOSPC  # Erişilemeyen dizinleri atla
+        self.watches[wd] = path
+        return True
+
+    def watch_all(self):
+        """Tam yenileme yapar; her dizine okunmadan önce izleme ekler ki arada oluşan girdiler kaçmasın"""
+        self.needs_rescan = False
+        watched = True
+
+        def before_visit(path):
+            nonlocal watched
+            watched = self.is_running and self.add_watch(path)  # İzlenen dizinde aynı wd döner
+            return watched
+
+        for _ in self.index.refresh(before_visit):
+            pass
+        return watched
+
+    def watch_tree(self, path):
+        """Yeni oluşan bir dizin ağacını listeler ve izlemeye alır"""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            if not self.add_watch(current):
+                return False
+            added, _ = self.index.update_dir(current)
+            stack.extend(added)
+        return True
+
+    def read_events(self):
+        """inotify olaylarını okuyup değişen dizinleri sıraya ekler"""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            wd, mask, _, name_len = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size + name_len
+            if mask & IN_Q_OVERFLOW:
+                self.needs_rescan = True
+                continue
+            path = self.watches.get(wd)
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+            elif mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                self.pending.add(os.path.dirname(path))
+            else:
+                self.pending.add(path)
+        if len(self.pending) > WATCH_QUEUE_SIZE:
+            self.needs_rescan = True
+
+    def event_loop(self):
+        while self.is_running:
+            readable, _, _ = select.select([self.fd], [], [], 0.5)
+            if readable:
+                self.read_events()
+                continue  # Olay patlamalarını tek seferde işlemek için önce kuyruğu boşalt
+
+            if self.needs_rescan:
+                # Kuyruk taştı, değişiklikleri mtime karşılaştırmasıyla bul
+                self.pending.clear()
+                self.index.live = False
+                if not self.watch_all():
+                    return self.fall_back_to_polling()
+                self.index.live = True
+                continue
+
+            while self.pending and self.is_running:
+                self.updated = True
+                added, _ = self.index.update_dir(self.pending.pop())
+                for sub_path in added:
+                    if not self.watch_tree(sub_path):
+                        return self.fall_back_to_polling()
+
+    def fall_back_to_polling(self):
+        """İzleme sınırı doldu: inotify'ı kapat, periyodik yoklamaya geç"""
+        self.index.live = False
+        self.close_inotify()
+        self.poll_loop()
+
+    def poll_loop(self):
+        while self.is_running:
+            if not self.index.refreshing:
+                for _ in self.index.refresh():
+                    if not self.is_running:
+                        break
+            deadline = time.monotonic() + WATCH_POLL_INTERVAL
+            while self.is_running and time.monotonic() < deadline:
+                time.sleep(0.5)
+
+class ContentIndexer(threading.Thread):
+    """Ev dizinindeki metin dosyalarını arka planda ContentIndex'e ekleyen iş parçacığı.
+
+    Dosya listesi IndexWatcher'ın güncel tuttuğu FileIndex'ten alınır.
+    Her geçişte yalnızca (boyut, mtime, inode) kaydı değişen dosyalar
+    okunur. Dosyalar kilitsiz okunur; sonuçları dosya dosya, yalnızca
+    bekleyen arama yokken _search_lock alınarak dizine yazılır. Geçişler
+    CONTENT_INDEX_INTERVAL aralıkla tekrarlanır.
+    """
+
+    def __init__(self, content_index, file_index):
+        super().__init__(daemon=True)
+        self.content_index = content_index
+        self.file_index = file_index
+        self.is_running = True
+        self.discard = False  # Durunca dizin dosyası silinsin mi
+
+    def stop(self, discard=False):
+        self.discard = discard
+        self.is_running = False
+
+    def run(self):
+        if not self.content_index.loaded:
+            with _search_lock:
+                self.content_index.load()
+        try:
+            self.index_loop()
+        finally:
+            # Yarıda kalan geçişte okunanlar da saklanır
+            if self.discard:
+                self.content_index.delete()
+            elif self.content_index.changed:
+                self.content_index.save()
+
+    def index_loop(self):
+        while self.is_running:
+            # Dosya adı dizini ilk yenilemesini bitirene kadar bekle
+            if self.file_index.loaded and not self.file_index.refreshing:
+                self.index_pass()
+                delay = CONTENT_INDEX_INTERVAL
+            else:
+                delay = 1
+            deadline = time.monotonic() + delay
+            while self.is_running and time.monotonic() < deadline:
+                time.sleep(0.5)
+
+    def index_pass(self):
+        """Tüm metin dosyalarını denetler, silinenleri dizinden çıkarır"""
+        content_index = self.content_index
+        content_index.begin_pass()
+        for root, _, files in self.file_index.iter_dirs():
+            names = [name for name in files if file_extension(name) not in TEXT_EXTRACTORS]
+            records = content_index.dir_records(root)
+            for name in names:
+                path = os.path.join(root, name)
+                changes = content_index.read_changes(path, records.get(name))
+                if changes is None:
+                    continue
+                if not self.acquire_idle():
+                    return
+                try:
+                    content_index.apply(path, changes)
+                finally:
+                    _search_lock.release()
+            if not content_index.dir_records(root):
+                continue  # Kaydı olmayan dizinde silinecek dosya yok
+            if not self.acquire_idle():
+                return
+            try:
+                content_index.mark_dir(root, set(names))
+            finally:
+                _search_lock.release()
+        if not self.acquire_idle():
+            return
+        try:
+            content_index.remove_unseen()
+        finally:
+            _search_lock.release()
+        if content_index.changed:
+            content_index.save()  # Yalnızca okur, aramalarla birlikte yapılabilir
+
+    def acquire_idle(self):
+        """Bekleyen arama yokken _search_lock'u alır; durdurulursa False döner"""
+        while self.is_running:
+            if _search_waiting.is_set():
+                # Hâlâ bekleyen arama işareti kısa sürede yeniden koyar
+                _search_waiting.clear()
+            elif _search_lock.acquire(blocking=False):
+                return True
+            time.sleep(0.2)
+        return False
+
+class FileSearch:
+    """Arayüzden bağımsız arama çekirdeği.
+
+    Sonuçları (yol, is_dir) grupları halinde üreten bir üreteç sunar; Qt
+    arayüzü ve komut satırı aynı çekirdeği kullanır. İlerleme yüzdesi
+    verilirse progress_callback ile bildirilir.
+    """
+
+    def __init__(self, search_query, content_search=False, search_paths=None, file_formats=None,
+                 candidates=None, progress_callback=None, query_mode=QUERY_TEXT, pool=None,
+                 content_index=None):
         self.search_query = search_query.lower()  # Aramayı küçük harfe çevir
+        # Regex/glob desenleri arama başına bir kez derlenir; geçersiz desen re.error verir
+        self.matcher = QueryMatcher(search_query, query_mode)
+        # Düz metin kipinde AND/NOT veya alan içeren sorgular planlanarak değerlendirilir
+        self.plan = None
+        if query_mode == QUERY_TEXT and is_compound_query(search_query):
+            self.plan = QueryPlan(search_query, content_search)
+            candidates = None
         self.content_search = content_search
-        self.root_search = root_search  # Bağlı disklerde ara seçeneği
-        self.file_format = file_format.lower() if file_format else None
+        self.search_paths = search_paths or [HOME_DIR]
+        # Uzantılar bir kez frozenset'e çevrilir; dosya başına yalnızca son ek aranır
+        self.file_formats = parse_extensions(file_formats)
+        self.progress_callback = progress_callback
         self.is_running = True
-        self.total_files = 0
-        self.processed_files = 0
+        # Uygulamanın havuzu verilmezse arama kendi havuzunu açar ve sonunda kapatır
+        self.pool = pool if pool is not None else WorkerPool()
+        self.owns_pool = pool is None
+        self.token = self.pool.new_token()  # Gezinme, içerik okuma ve işçi süreçler için
+        self.result_count = 0
+        self.pending_results = []  # Henüz teslim edilmemiş sonuçlar
+        self.last_flush = time.monotonic()
+        self.last_percent = -1
+        self.processed_items = 0
+        self.total_items = 1
+        self.path_counts = {}  # Arama kökü -> taranan öğe sayısı
+        self.content_batch = []  # Henüz işçilere gönderilmemiş içerik adayları
+        self.document_batch = []  # Metni çıkarılacak PDF/Office belgeleri
+        self.documents_submitted = False  # Metin önbelleği arama sonunda bütçeye göre budanır
+        self.pending = set()  # Sonucu beklenen içerik arama grupları
+        self.jobs = {}  # Bekleyen grup -> (havuz türü, fonksiyon, argümanlar, yeniden denendi mi)
+        # Yüklü içerik dizini verilirse kelimelerini içermediği kesin dosyalar okunmaz
+        self.content_index = content_index if content_search and content_index is not None and \
+            content_index.loaded else None
+        self.index_candidates = {}  # Gerekli terimler -> aday dosya numaraları (veya None)
+        # Önceki aramanın sonuçları (ResultList); verilirse disk taranmaz,
+        # yalnızca bu adaylar daraltılır
+        self.candidates = candidates
+        # Önbelleğe yazılacak sonuçlar; bütçe aşılırsa toplama bırakılır.
+        # Dosya boyutuna veya içeriğine bakan aramalar saklanmaz: dosya düzenlemeleri
+        # dizin sürümünü değiştirmez
+        self.cacheable = not content_search and (self.plan is None or not self.plan.reads_files())
+        self.cache_results = ResultList()
 
     def stop(self):
         self.is_running = False
+        self.token.cancel()
 
-    def run(self):
+    def __iter__(self):
+        """Eşleşmeleri tek tek verir"""
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self):
+        """Eşleşmeleri RESULT_BATCH_SIZE / RESULT_BATCH_INTERVAL ile gruplayarak verir.
+
+        Aynı anda yalnızca bir arama disk okur: yeni arama, öncekinin
+        iptal edilip işçileriyle birlikte bitmesini bekler.
+        """
+        if not self.search_query:
+            return
+        while not _search_lock.acquire(timeout=0.05):
+            _search_waiting.set()
+            if not self.is_running:
+                return
+        set_cancel_token(self.token)
         try:
-            if not self.search_query:
-                self.status.emit("Arama terimi giriniz", "#ffcc00")
+            if self.candidates is not None:
+                self.cacheable = False
+                yield from self.refine_candidates()
+                yield from self.remaining_results()
                 return
 
-            matching_items = []
-            search_paths = [HOME_DIR] if not self.root_search else get_mounted_paths()
-            
-            if self.root_search and not search_paths:
-                self.status.emit("Bağlı disk bulunamadı!", "#ff6666")
-                search_paths = [HOME_DIR]
+            search_paths = self.search_paths
 
-            total_items = 0
-            # İlk tarama - toplam öğe sayısını bul
-            for path in search_paths:
-                try:
-                    for root, dirs, files in os.walk(path):
-                        if not self.is_running:
-                            break
-                        total_items += len(dirs) + len(files)
-                except PermissionError:
-                    continue
+            # Aynı arama yakın zamanda yapıldıysa ve kökler değişmediyse önbellekten yanıtla.
+            # Desenler küçük harfe çevrilmeden anahtarlanır: \d ile \D farklı sorgulardır
+            query_key = self.search_query
+            if self.plan is not None:
+                query_key = self.plan.key()
+            elif self.matcher.name_pattern is not None:
+                query_key = self.matcher.name_pattern.pattern
+            cache_key = (query_key, self.matcher.mode, self.content_search, self.file_formats,
+                         tuple(sorted(search_paths)))
+            cached = self.cached_results(cache_key)
+            if cached is not None:
+                yield from cached
+                yield from self.remaining_results()
+                return
+            # Önbellek kaydı, sonuçların kurulduğu andaki FileIndex sürümleriyle saklanır
+            versions = {}
+
+            # Ayrı bir sayım taraması yapmadan tahmini toplam ile başla,
+            # tarama ilerledikçe tahmini düzelt
+            item_totals = load_item_totals()
+            self.total_items = max(sum(estimate_item_count(path, item_totals) for path in search_paths), 1)
 
-            processed_items = 0
+            stale_indexes = []
             for base_path in search_paths:
                 if not self.is_running:
                     break
 
-                try:
-                    for root, dirs, files in os.walk(base_path, topdown=True):
+                file_index = get_file_index(base_path)
+
+                # Yalnızca düz metinle ad araması yapılıyorsa trigram dizininden yanıtla
+                trigrams = None
+                if not self.content_search and self.matcher.mode == QUERY_TEXT and self.plan is None:
+                    trigrams = file_index.usable_trigrams()
+                if trigrams is not None:
+                    versions[base_path] = file_index.version
+                    file_formats = self.file_formats
+                    for item in trigrams.search(self.search_query, file_index):
+                        if file_formats and not item[1] and file_extension(os.path.basename(item[0])) not in file_formats:
+                            continue
+                        self.add_result(item)
+                        if self.batch_ready():
+                            yield self.take_results()
+
+                # İzlenen dizin canlıysa doğrudan bellekten ara; kullanılabilir
+                # trigram dizini yoksa sonraki ad aramaları için onu da kur
+                elif file_index.live:
+                    versions[base_path] = file_index.version
+                    if file_index.usable_trigrams() is None:
+                        trigrams = file_index.start_trigrams()
+                    for root, record in file_index.iter_records():
                         if not self.is_running:
                             break
+                        dirs, files = record_entries(record)
+                        if trigrams is not None:
+                            trigrams.add_dir(root, record, dirs, files)
+                        self.search_dir(base_path, root, dirs, files)
+                        if self.batch_ready():
+                            yield self.take_results()
+                    if trigrams is not None and self.is_running:
+                        file_index.finish_trigrams(trigrams)
 
-                        # Dizin araması - case insensitive
-                        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-                        for dir_name in dirs:
-                            processed_items += 1
-                            self.progress.emit(int((processed_items / total_items) * 100))
-                            
-                            if self.search_query in dir_name.lower():
-                                full_path = os.path.join(root, dir_name)
-                                matching_items.append((full_path, True))
-
-                        # Dosya araması - case insensitive
-                        for name in files:
-                            processed_items += 1
-                            self.progress.emit(int((processed_items / total_items) * 100))
-
-                            if self.file_format and not name.lower().endswith(f'.{self.file_format}'):
-                                continue
+                else:
+                    stale_indexes.append(file_index)
 
-                            full_path = os.path.join(root, name)
-                            
-                            # İsim araması - case insensitive
-                            if self.search_query in name.lower():
-                                matching_items.append((full_path, False))
-                                continue
+            # Canlı olmayan kökler, yalnızca değişen dizinler yeniden
+            # listelenerek ve birlikte paralel gezilerek aranır
+            if stale_indexes and self.is_running:
+                for file_index, root, dirs, files in refresh_indexes(stale_indexes):
+                    if not self.is_running:
+                        break
+                    self.search_dir(file_index.root, root, dirs, files)
+                    if self.batch_ready():
+                        yield self.take_results()
+            # Yenileme değişiklik bulduysa (ilk kurulum dahil) sürüm arttı; yenilenmiş sürüm saklanır
+            for file_index in stale_indexes:
+                versions[file_index.root] = file_index.version
+
+            yield from self.finish_content_search()
+
+            # Yolların gerçek sayılarını bir sonraki tahmin için sakla
+            if self.path_counts and self.is_running:
+                item_totals.update(self.path_counts)
+                save_item_totals(item_totals)
+
+            if self.cacheable and self.is_running:
+                _result_cache.put(cache_key, tuple(versions.get(path) for path in search_paths),
+                                  self.cache_results)
+
+            yield from self.remaining_results()
+
+        except SearchCancelled:
+            pass
+
+        finally:
+            # Durdurulan aramada bekleyen grupları iptal et; çalışan işler
+            # jetonu görüp bitene kadar beklenir ki sonraki arama diske tek başına erişsin
+            self.token.cancel()
+            for future in self.pending:
+                future.cancel()
+            if not self.is_running:
+                wait(self.pending)
+            self.pending, self.jobs = set(), {}
+            if self.owns_pool:
+                self.pool.shutdown(wait=not self.is_running)
+            set_cancel_token(None)
+            _search_lock.release()
+
+    def cached_results(self, cache_key):
+        """Geçerli bir önbellek kaydı varsa sonuçlarını veren üreteci döndürür"""
+        entry = _result_cache.get(cache_key) if self.cacheable else None
+        if entry is None:
+            return None
+        versions, _, results = entry
+
+        # Canlı dizinler anlık günceldir; diğerleri dizin mtime'larıyla yenilenir
+        file_indexes = [get_file_index(path) for path in self.search_paths]
+        for _ in refresh_indexes([file_index for file_index in file_indexes if not file_index.live]):
+            if not self.is_running:
+                return iter(())
+        if tuple(file_index.version for file_index in file_indexes) != versions:
+            _result_cache.discard(cache_key)
+            return None
+
+        self.cacheable = False
+        return self.replay_results(results)
+
+    def replay_results(self, results):
+        for item in results:
+            if not self.is_running:
+                return
+            self.add_result(item)
+            if self.batch_ready():
+                yield self.take_results()
 
-                            # İçerik araması - case insensitive
-                            if self.content_search:
-                                try:
-                                    if os.path.getsize(full_path) > MAX_FILE_SIZE:
-                                        continue
-                                        
-                                    # Binary dosyaları atla
-                                    if is_binary_file(full_path):
-                                        continue
-                                        
-                                    with open(full_path, 'r', encoding='utf-8') as f:
-                                        content = f.read().lower()  # İçeriği küçük harfe çevir
-                                        if self.search_query in content:  # Arama terimi zaten küçük harfte
-                                            matching_items.append((full_path, False))
-                                except (PermissionError, UnicodeDecodeError):
-                                    continue
-
-                except PermissionError:
+    def refine_candidates(self):
+        """Önceki sonuçları yeni sorguya göre daraltır.
+
+        Yeni sorgu öncekini içerdiğinden eşleşmeler önceki sonuçların alt
+        kümesidir: adı eşleşmeyen dosyaların yalnızca içeriği yeniden
+        kontrol edilir, sonuçlarda olmayan dosyalara hiç bakılmaz.
+        """
+        self.total_items = max(len(self.candidates), 1)
+        for item, (path, is_dir) in enumerate(self.candidates):
+            if not self.is_running:
+                return
+            if self.matcher.matches(os.path.basename(path)):
+                self.add_result((path, is_dir))
+            elif self.content_search and not is_dir and file_extension(os.path.basename(path)) in TEXT_EXTRACTORS:
+                self.queue_document(path, self.matcher_terms())
+            elif self.content_search and not is_dir:
+                self.content_batch.append(path)
+                if len(self.content_batch) >= CHUNK_SIZE:
+                    self.submit_content_batch()
+                    self.collect_content_matches(block=len(self.pending) >= MAX_WORKERS * 2)
+            if item % 1000 == 0:
+                self.report_progress(item, self.total_items)
+            if self.batch_ready():
+                yield self.take_results()
+        yield from self.finish_content_search()
+
+    def search_dir(self, base_path, root, dirs, files):
+        """Bir dizinin alt dizin ve dosya adlarını arar, içerik adaylarını kuyruğa ekler"""
+        # Tahmin aşıldıysa toplamı büyüt, %100'e erken ulaşma
+        count = len(dirs) + len(files)
+        self.path_counts[base_path] = self.path_counts.get(base_path, 0) + count
+        self.processed_items += count
+        if self.processed_items >= self.total_items:
+            self.total_items = int(self.processed_items * 1.25) + 1
+        self.report_progress(self.processed_items, self.total_items)
+
+        if self.plan is not None:
+            self.search_dir_planned(root, dirs, files)
+            return
+
+        matches = self.matcher.matches
+        file_formats = self.file_formats
+
+        # Dizin araması - case insensitive
+        for dir_name in dirs:
+            if matches(dir_name):
+                self.add_result((os.path.join(root, dir_name), True))
+
+        # Dosya araması - case insensitive
+        for name in files:
+            # Uzantı filtresi, yol birleştirme ve stat'tan önce
+            if file_formats:
+                dot = name.rfind('.')
+                if dot <= 0 or name[dot + 1:].lower() not in file_formats:
                     continue
 
-            self.progress.emit(100)
-            if matching_items:
-                self.status.emit(f"{len(matching_items)} sonuç bulundu", "#66ff66")
+            # İsim araması - case insensitive; tam yol yalnızca gerektiğinde kurulur
+            if matches(name):
+                self.add_result((os.path.join(root, name), False))
+                continue
+
+            # İçerik araması - dosyalar gruplar halinde işçi süreçlere dağıtılır
+            if self.content_search:
+                if file_extension(name) in TEXT_EXTRACTORS:
+                    self.queue_document(os.path.join(root, name), self.matcher_terms())
+                    continue
+                path = os.path.join(root, name)
+                if self.content_index is not None and self.indexed_out(path, self.matcher_terms()[0]):
+                    continue
+                self.content_batch.append(path)
+                if len(self.content_batch) >= CHUNK_SIZE:
+                    self.submit_content_batch()
+                    # Bekleyen grup sayısını sınırla, biten grupların sonuçlarını al
+                    self.collect_content_matches(block=len(self.pending) >= MAX_WORKERS * 2)
+
+    def search_dir_planned(self, root, dirs, files):
+        """Birleşik sorguyu önce ad/uzantı/boyutla eler, kalan terimler için içerik taraması kuyruğa ekler"""
+        plan = self.plan
+        file_formats = self.file_formats
+        for dir_name in dirs:
+            if plan.match_dir(dir_name):
+                self.add_result((os.path.join(root, dir_name), True))
+
+        for name in files:
+            if file_formats and file_extension(name) not in file_formats:
+                continue
+            terms = plan.match_file(root, name)
+            if terms is None:
+                continue
+            required, forbidden = terms
+            if not required and not forbidden:
+                self.add_result((os.path.join(root, name), False))
+                continue
+            if file_extension(name) in TEXT_EXTRACTORS:
+                self.queue_document(os.path.join(root, name), terms)
+                continue
+            path = os.path.join(root, name)
+            if self.content_index is not None and self.indexed_out(path, required):
+                continue
+            self.content_batch.append((path, required, forbidden))
+            if len(self.content_batch) >= CHUNK_SIZE:
+                self.submit_content_batch()
+                self.collect_content_matches(block=len(self.pending) >= MAX_WORKERS * 2)
+
+    def indexed_out(self, path, required):
+        """İçerik dizini dosyanın gerekli terimleri içermediğini biliyorsa True döner"""
+        if not required:
+            return False
+        candidates = self.index_candidates.get(required, False)
+        if candidates is False:
+            candidates = self.index_candidates[required] = self.content_index.candidates(required)
+        if candidates is None:
+            return False
+        file_id = self.content_index.lookup(path)
+        return file_id is not None and file_id not in candidates
+
+    def matcher_terms(self):
+        """Düz metin ve desen aramalarında belgelerde aranacak (gerekli, yasak) terimler"""
+        return ((self.matcher.literal,) if self.matcher.literal else ()), ()
+
+    def queue_document(self, path, terms):
+        """Belgeyi metin çıkarma kuyruğuna ekler"""
+        self.document_batch.append((path,) + tuple(terms))
+        if len(self.document_batch) >= DOCUMENT_CHUNK_SIZE:
+            self.submit_document_batch()
+            self.collect_content_matches(block=len(self.pending) >= MAX_WORKERS * 2)
+
+    def submit_document_batch(self):
+        """Belgeleri süre ve bellek sınırlı ayrı işçi havuzuna gönderir"""
+        pattern = self.matcher.content_pattern if self.plan is None else None
+        self.submit_job(POOL_DOCUMENTS, search_in_documents, (self.document_batch, pattern))
+        self.document_batch = []
+        self.documents_submitted = True
+
+    def content_job(self):
+        """Bekleyen içerik grubunu işleyecek fonksiyon ve argümanları"""
+        if self.plan is not None:
+            return search_terms_in_files, (self.content_batch,)
+        return search_in_files, (self.content_batch, self.matcher.literal, self.matcher.content_pattern)
+
+    def submit_content_batch(self):
+        function, args = self.content_job()
+        self.submit_job(POOL_CONTENT, function, args)
+        self.content_batch = []
+
+    def submit_job(self, kind, function, args, retried=False):
+        future = self.pool.submit(kind, self.token, function, *args)
+        self.jobs[future] = (kind, function, args, retried)
+        self.pending.add(future)
+
+    def finish_content_search(self):
+        """Kalan grubu işler ve bekleyen tüm grupların sonuçlarını toplar"""
+        # Havuz henüz açılmadıysa küçük aramalar için süreç başlatma
+        if self.content_batch and self.is_running:
+            if not self.pool.started(POOL_CONTENT):
+                function, args = self.content_job()
+                for item in function(*args):
+                    self.add_result(item)
+                self.content_batch = []
             else:
-                self.status.emit("Sonuç bulunamadı", "#ff6666")
-                
-            self.finished.emit(matching_items)
+                self.submit_content_batch()
+        if self.document_batch and self.is_running:
+            self.submit_document_batch()
+        while self.pending and self.is_running:
+            self.collect_content_matches(block=True)
+            if self.batch_ready():
+                yield self.take_results()
+        if self.documents_submitted and self.is_running:
+            prune_text_cache()
+
+    def report_progress(self, processed_items, total_items):
+        """İlerlemeyi yalnızca tam sayı yüzde arttığında bildirir.
+
+        Her öğe için sinyal göndermek iş parçacıkları arası milyonlarca
+        kuyruklu olay üretir; bu sayede en fazla 100 bildirim yapılır ve
+        tahmin düzeltildiğinde ilerleme çubuğu geri gitmez.
+        """
+        percent = processed_items * 100 // total_items
+        if percent > self.last_percent:
+            self.last_percent = percent
+            if self.progress_callback is not None:
+                self.progress_callback(percent)
+
+    def add_result(self, item):
+        """Sonucu teslim edilmeyi bekleyenlere ekler"""
+        self.pending_results.append(item)
+        self.result_count += 1
+        if self.cacheable:
+            self.cache_results.append(*item)
+            if self.cache_results.size > _result_cache.budget_bytes:
+                self.cacheable = False
+                self.cache_results = None
+
+    def batch_ready(self):
+        """Grup dolduysa veya seyrek eşleşmelerde süre geçtiyse True döner"""
+        return bool(self.pending_results) and (
+            len(self.pending_results) >= RESULT_BATCH_SIZE or
+            time.monotonic() - self.last_flush >= RESULT_BATCH_INTERVAL)
+
+    def take_results(self):
+        results, self.pending_results = self.pending_results, []
+        self.last_flush = time.monotonic()
+        return results
+
+    def remaining_results(self):
+        if self.pending_results and self.is_running:
+            yield self.take_results()
+
+    def collect_content_matches(self, block=False):
+        """Tamamlanan içerik arama gruplarının sonuçlarını ekler"""
+        done, self.pending = wait(self.pending, timeout=0.2 if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            kind, function, args, retried = self.jobs.pop(future)
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                for item in future.result():
+                    self.add_result(item)
+            elif isinstance(error, BrokenProcessPool) and not retried and self.is_running:
+                # Havuz bu grup işlenirken çöktü; yeni havuzda bir kez daha dene
+                self.submit_job(kind, function, args, retried=True)
+
+# SearchWorker sınıfında güncelleme
+class SearchWorker(QThread):
+    """FileSearch çekirdeğini arka planda yürütüp sonuçları sinyallerle ileten worker sınıfı"""
+    results_batch = pyqtSignal(list)  # [(path, is_dir), ...] sonuçlar bulundukça
+    finished = pyqtSignal(int)  # Toplam sonuç sayısı
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)  # Progress sinyali
+    status = pyqtSignal(str, str)  # (mesaj, renk) için yeni sinyal
+
+    def __init__(self, search_query, content_search=False, root_search=False, file_formats=None,
+                 query_mode=QUERY_TEXT, candidates=None, pool=None, content_index=None):
+        super().__init__()
+        self.root_search = root_search  # Bağlı disklerde ara seçeneği
+        self.search = FileSearch(search_query, content_search, None, file_formats,
+                                 candidates=candidates, progress_callback=self.progress.emit,
+                                 query_mode=query_mode, pool=pool, content_index=content_index)
+
+    def stop(self):
+        self.search.stop()
+
+    def run(self):
+        try:
+            if not self.search.search_query:
+                self.status.emit("Arama terimi giriniz", "#ffcc00")
+                return
+
+            if self.root_search:
+                self.search.search_paths = get_mounted_paths()
+                if not self.search.search_paths:
+                    self.status.emit("Bağlı disk bulunamadı!", "#ff6666")
+                    self.search.search_paths = [HOME_DIR]
+
+            for results in self.search.batches():
+                # Durdurulan arama yeni aramanın sonuçlarına karışmasın
+                if self.search.is_running:
+                    self.results_batch.emit(results)
+
+            self.finish_search()
 
         except Exception as e:
             self.error.emit(str(e))
             self.status.emit(f"Hata: {str(e)}", "#ff6666")
 
-    def is_binary(self, file_path):
-        """Dosyanın binary olup olmadığını kontrol et"""
-        try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(1024)
-                return b'\0' in chunk  # Null bayt varsa binary dosyadır
-        except:
-            return True
+    def finish_search(self):
+        """Aramanın bittiğini bildirir"""
+        if not self.search.is_running:
+            return
+
+        result_count = self.search.result_count
+        self.progress.emit(100)
+        if result_count:
+            self.status.emit(f"{result_count} sonuç bulundu", "#66ff66")
+        else:
+            self.status.emit("Sonuç bulunamadı", "#ff6666")
+
+        self.finished.emit(result_count)
+
+_worker_board = None  # İşçi süreçte WorkerPool'un iptal sayacı
+
+def init_content_worker(board):
+    global _worker_board
+    _worker_board = board
+
+def run_job(generation, function, *args):
+    """İşçi süreçte işi, aramanın kuşağıyla kurulan iptal jetonuyla çalıştırır"""
+    set_cancel_token(CancelToken(_worker_board, generation) if _worker_board is not None else None)
+    try:
+        return function(*args)
+    finally:
+        set_cancel_token(None)
 
 def search_in_file(args):
-    """Dosya içeriğinde arama yapar"""
-    file_path, search_query = args
+    """Dosya içeriğinde arama yapar.
+
+    Boyut kontrolü (fstat), binary kontrolü ve içerik taraması aynı dosya
+    tanıtıcısı üzerinden yapılır; binary kontrolü için okunan ilk bayt
+    taramada yeniden okunmaz. args (yol, sorgu) ya da desen aramalarında
+    (yol, zorunlu alt dize, derlenmiş desen) biçimindedir.
+    """
+    file_path, search_query, pattern = args if len(args) == 3 else (*args, None)
+    if pattern is not None:
+        found = scan_file(file_path, lambda fd, first_chunk, size:
+                          file_matches(fd, search_query, pattern, first_chunk, size))
+    else:
+        found = scan_file(file_path, lambda fd, first_chunk, size:
+                          file_contains(fd, search_query, first_chunk, size))
+    return file_path if found else None
+
+def scan_file(file_path, match, skipped=False):
+    """Dosyayı açar ve match(fd, first_chunk, size) sonucunu döndürür.
+
+    Okunamayan, boş, MAX_FILE_SIZE'dan büyük veya binary dosyalarda içeriğe
+    bakılmaz ve skipped döndürülür.
+    """
+    check_cancelled()
     try:
-        if os.path.getsize(file_path) > MAX_FILE_SIZE:
-            return None
-            
-        # Binary dosyaları atla
-        if is_binary_file(file_path):
+        # O_NONBLOCK: adlandırılmış borularda açılış beklemesin
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_NONBLOCK', 0))
+    except OSError:
+        return skipped
+    try:
+        file_stat = os.fstat(fd)
+        size = file_stat.st_size
+        if not stat.S_ISREG(file_stat.st_mode) or not size or size > MAX_FILE_SIZE:
+            return skipped
+
+        # Binary dosyaları atla; küçük dosyalar kontrolle birlikte tümüyle okunur
+        first_chunk = os.read(fd, size if size <= SMALL_FILE_SIZE else BINARY_SNIFF_SIZE)
+        if b'\0' in first_chunk[:BINARY_SNIFF_SIZE]:
+            return skipped
+
+        return match(fd, first_chunk, size)
+    except OSError:
+        return skipped
+    finally:
+        os.close(fd)
+
+def read_tokens(fd, first_chunk=b'', size=None):
+    """Açık dosyanın katlanmış içeriğindeki kelimeleri küme olarak döndürür"""
+    return set(CONTENT_TOKEN.findall(''.join(folded_text_chunks(fd, first_chunk, size))))
+
+def search_in_files(file_paths, search_query, pattern=None):
+    """Bir grup dosyada içerik araması yapar, eşleşenleri [(path, False), ...] döndürür"""
+    return [(path, False) for path in file_paths if search_in_file((path, search_query, pattern))]
+
+def search_terms_in_files(items):
+    """Birleşik sorgu adaylarını tarar.
+
+    items [(path, gerekli terimler, yasak terimler), ...] biçimindedir;
+    eşleşenler [(path, False), ...] olarak döner. Yalnızca yasak terimi
+    kalan ve içeriği okunamayan dosyalar adlarıyla eşleşmiş sayılır.
+    """
+    return [(path, False) for path, required, forbidden in items
+            if scan_file(path, lambda fd, first_chunk, size:
+                         contains_terms(fd, required, forbidden, first_chunk, size),
+                         skipped=not required)]
+
+class ExtractionTimeout(Exception):
+    pass
+
+def extract_pdf_text(path):
+    """PDF sayfalarının metnini PyPDF2 ile çıkarır"""
+    try:
+        from PyPDF2 import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfFileReader as PdfReader  # PyPDF2 < 2
+        except ImportError:
             return None
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().lower()
-            if search_query.lower() in content:
-                return file_path
-    except (PermissionError, UnicodeDecodeError):
+    pieces = []
+    length = 0
+    for page in PdfReader(path, strict=False).pages:
+        check_cancelled()
+        text = page.extract_text() if hasattr(page, 'extract_text') else page.extractText()
+        pieces.append(text or '')
+        length += len(pieces[-1])
+        if length >= MAX_EXTRACTED_CHARS:
+            break
+    return '\n'.join(pieces)
+
+def zipped_xml_extractor(member_pattern):
+    """Zip içindeki XML parçalarından paragraf paragraf metin çıkaran fonksiyon döndürür.
+
+    XML iterparse ile akış halinde okunur; her paragraf (p, h) veya hücre
+    metni (si, is) tamamlanınca alınır ve öğe bellekten atılır.
+    """
+    member_regex = re.compile(member_pattern)
+
+    def extract(path):
+        pieces = []
+        length = 0
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                if not member_regex.fullmatch(member):
+                    continue
+                with archive.open(member) as stream:
+                    for _, element in ElementTree.iterparse(stream):
+                        if element.tag.rpartition('}')[2] in ('p', 'h', 'si', 'is'):
+                            check_cancelled()
+                            pieces.append(''.join(element.itertext()))
+                            length += len(pieces[-1])
+                            element.clear()
+                            if length >= MAX_EXTRACTED_CHARS:
+                                return '\n'.join(pieces)
+        return '\n'.join(pieces)
+    return extract
+
+# Uzantı -> metin çıkarıcı; yeni biçimler buraya eklenerek desteklenir
+TEXT_EXTRACTORS = {
+    'pdf': extract_pdf_text,
+    'docx': zipped_xml_extractor(r'word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml'),
+    'xlsx': zipped_xml_extractor(r'xl/(sharedStrings|worksheets/sheet\d+)\.xml'),
+    'pptx': zipped_xml_extractor(r'ppt/(slides/slide\d+|notesSlides/notesSlide\d+)\.xml'),
+    'odt': zipped_xml_extractor(r'content\.xml'),
+    'ods': zipped_xml_extractor(r'content\.xml'),
+    'odp': zipped_xml_extractor(r'content\.xml'),
+}
+
+def text_cache_path(path):
+    return os.path.join(TEXT_CACHE_DIR, hashlib.sha1(path.encode('utf-8', 'surrogateescape')).hexdigest())
+
+def load_extracted_text(path, file_stat):
+    """Önbellekteki metni (yol, boyut, mtime) eşleşiyorsa döndürür; kullanılan kaydın mtime'ı tazelenir"""
+    cache_path = text_cache_path(path)
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            if f.readline() != f'{file_stat.st_size} {file_stat.st_mtime_ns}\n':
+                return None
+            text = f.read()
+        os.utime(cache_path)
+        return text
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def save_extracted_text(path, file_stat, text):
+    cache_path = text_cache_path(path)
+    try:
+        os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f'{file_stat.st_size} {file_stat.st_mtime_ns}\n')
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
         pass
-    return None
 
-def is_binary_file(file_path):
-    """Dosyanın binary olup olmadığını kontrol eder"""
+def prune_text_cache(budget_bytes=TEXT_CACHE_MB * 1024 * 1024):
+    """Metin önbelleği bütçeyi aşarsa en uzun süredir kullanılmayan kayıtları siler.
+
+    Silinen veya taşınan belgelerin kayıtları bir daha okunmadığından
+    zamanla bu yolla temizlenir; değişen belgenin kaydı yeniden çıkarmada
+    üzerine yazılır.
+    """
+    entries = []
+    total = 0
     try:
-        with open(file_path, 'rb') as f:
-            chunk = f.read(1024)
-            return b'\0' in chunk
-    except:
-        return True
+        with os.scandir(TEXT_CACHE_DIR) as cache_entries:
+            for entry in cache_entries:
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+                total += entry_stat.st_size
+    except OSError:
+        return
+    if total <= budget_bytes:
+        return
+    entries.sort()
+    for _, size, cache_path in entries:
+        try:
+            os.remove(cache_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= budget_bytes:
+            break
+
+def raise_extraction_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+def init_extraction_worker(board=None):
+    """Metin çıkarma işçisinin adres alanını o anki kullanımın EXTRACT_MEMORY_MB üstüyle sınırlar"""
+    init_content_worker(board)
+    try:
+        import resource
+        with open('/proc/self/statm') as f:
+            used = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+        limit = used + EXTRACT_MEMORY_MB * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+    except (ImportError, OSError, ValueError):
+        pass  # Sınır desteklenmiyorsa yalnızca süre sınırı uygulanır
+    if hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, raise_extraction_timeout)
+
+def extract_text(path):
+    """Belgenin metnini önbellekten veya çıkarıcıyla döndürür; çıkarılamazsa None.
+
+    Bozuk belgeler boş metin olarak önbelleğe alınır; süre veya bellek
+    sınırını aşan belgeler bir sonraki aramada yeniden denenir.
+    """
+    extractor = TEXT_EXTRACTORS.get(file_extension(os.path.basename(path)))
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    if extractor is None or not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size > MAX_DOCUMENT_SIZE:
+        return None
+    text = load_extracted_text(path, file_stat)
+    if text is not None:
+        return text
+
+    timer = hasattr(signal, 'setitimer') and signal.getsignal(signal.SIGALRM) is raise_extraction_timeout
+    if timer:
+        signal.setitimer(signal.ITIMER_REAL, EXTRACT_TIMEOUT)
+    try:
+        text = extractor(path)
+    except (ExtractionTimeout, MemoryError, SearchCancelled):
+        return None
+    except Exception:
+        text = ''  # Bozuk veya desteklenmeyen belge
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    if text is None:
+        return None
+    text = text[:MAX_EXTRACTED_CHARS]
+    save_extracted_text(path, file_stat, text)
+    return text
+
+def search_in_documents(items, pattern=None):
+    """Belgelerin çıkarılmış metninde arama yapar.
+
+    items [(path, gerekli terimler, yasak terimler), ...] biçimindedir;
+    desen verilirse terimler ön eleme olarak kullanılır. Eşleşenler
+    [(path, False), ...] olarak döner.
+    """
+    matches = []
+    for path, required, forbidden in items:
+        text = extract_text(path)
+        if text is None:
+            if not required and pattern is None:
+                matches.append((path, False))  # Yalnızca yasak terim kalmıştı
+            continue
+        folded = fold_case(text)
+        if any(fold_case(term) in folded for term in forbidden):
+            continue
+        if not all(fold_case(term) in folded for term in required):
+            continue
+        if pattern is None or pattern.search(text) is not None:
+            matches.append((path, False))
+    return matches
+
+def file_matches(fd, literal, pattern, first_chunk=b'', size=None):
+    """Açık dosyanın içeriğinde deseni arar.
+
+    Desenin zorunlu alt dizesi önce file_contains ile aranır; düzenli ifade
+    yalnızca bu ön elemeyi geçen dosyaların çözülmüş metninde çalışır.
+    """
+    if literal and not file_contains(fd, literal, first_chunk, size):
+        return False
+    if size is None or len(first_chunk) < size:
+        os.lseek(fd, 0, os.SEEK_SET)
+        first_chunk = b''.join(read_chunks(fd, b'', size))
+    return pattern.search(first_chunk.decode('utf-8', errors='replace')) is not None
+
+def fold_case(text):
+    """Türkçe i harflerini eşitleyerek büyük/küçük harf katlaması yapar"""
+    return text.translate(TURKISH_FOLD).casefold()
+
+def file_contains(fd, search_query, first_chunk=b'', size=None):
+    """Açık dosyada büyük/küçük harf duyarsız arama yapar, ilk eşleşmede durur.
+
+    Dosya, önceden okunmuş first_chunk'tan sonra sabit boyutlu parçalar
+    halinde bayt olarak okunur; parçalar arasında sorgu uzunluğu kadar
+    örtüşme bırakılır. ASCII sorgularda çözümleme yapılmaz; diğer sorgularda
+    parçalar UTF-8 olarak çözülüp katlanır.
+    """
+    query = fold_case(search_query)
+    if not query:
+        return False
+    if query.isascii():
+        return contains_ascii(fd, query.encode('ascii'), first_chunk, size)
+    return contains_unicode(fd, query, first_chunk, size)
+
+def read_chunks(fd, first_chunk, size=None):
+    """Önce first_chunk'ı, ardından dosyanın kalanını parça parça üretir.
+
+    Boyut biliniyorsa dosya sonunu doğrulamak için fazladan okuma yapılmaz.
+    """
+    remaining = None if size is None else size - len(first_chunk)
+    if first_chunk:
+        yield first_chunk
+    while remaining is None or remaining > 0:
+        check_cancelled()  # Büyük dosyalar her parçada iptal edilebilir
+        chunk = os.read(fd, CONTENT_CHUNK_SIZE)
+        if not chunk:
+            return
+        if remaining is not None:
+            remaining -= len(chunk)
+        yield chunk
+
+def contains_ascii(fd, needle, first_chunk=b'', size=None):
+    """ASCII sorguyu dosyanın baytlarında arar"""
+    if needle.lower() == needle.upper():
+        # Harf içermeyen sorguda katlama gerekmez, dosyayı kopyalamadan ara
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+        except (ValueError, OSError):
+            pass  # Boş veya eşlenemeyen dosya, parça parça oku
+
+    keep = len(needle) - 1
+    tail = b''
+    for folded in folded_byte_chunks(fd, first_chunk, size):
+        data = tail + folded
+        if needle in data:
+            return True
+        tail = data[-keep:] if keep else b''
+    return False
+
+def contains_unicode(fd, needle, first_chunk=b'', size=None):
+    """ASCII olmayan sorguyu UTF-8 çözülmüş ve katlanmış parçalarda arar"""
+    keep = len(needle) - 1
+    tail = ''
+    for folded in folded_text_chunks(fd, first_chunk, size):
+        data = tail + folded
+        if needle in data:
+            return True
+        tail = data[-keep:] if keep else ''
+    return False
+
+def folded_byte_chunks(fd, first_chunk=b'', size=None):
+    """Parçaları çözmeden küçük harfe ve Türkçe İ/ı'yı i'ye katlayarak üretir"""
+    carry = b''
+    for chunk in read_chunks(fd, first_chunk, size):
+        data = carry + chunk
+        # İ/ı'nın (C4 B0 / C4 B1) ilk baytı parça sonundaysa sonraki parçaya taşı
+        carry = b'\xc4' if data.endswith(b'\xc4') else b''
+        if carry:
+            data = data[:-1]
+        yield data.replace(b'\xc4\xb0', b'i').replace(b'\xc4\xb1', b'i').lower()
+
+def folded_text_chunks(fd, first_chunk=b'', size=None):
+    """Parçaları UTF-8 olarak çözüp fold_case ile katlayarak üretir"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in read_chunks(fd, first_chunk, size):
+        yield fold_case(decoder.decode(chunk))
+    yield fold_case(decoder.decode(b'', final=True))
+
+def contains_terms(fd, required, forbidden, first_chunk=b'', size=None):
+    """Tüm gerekli terimler bulunup yasak terimlerin hiçbiri yoksa True döner.
+
+    Dosya tek geçişte taranır; yasak bir terim görülünce ya da yasak terim
+    yokken gerekli terimlerin hepsi bulununca okuma durur.
+    """
+    needles = [fold_case(term) for term in required + forbidden]
+    if all(needle.isascii() for needle in needles):
+        needles = [needle.encode('ascii') for needle in needles]
+        chunks, tail = folded_byte_chunks(fd, first_chunk, size), b''
+    else:
+        chunks, tail = folded_text_chunks(fd, first_chunk, size), ''
+    remaining = set(needles[:len(required)])
+    forbidden = needles[len(required):]
+    keep = max(map(len, needles)) - 1
+    for folded in chunks:
+        data = tail + folded
+        if any(needle in data for needle in forbidden):
+            return False
+        remaining = {needle for needle in remaining if needle not in data}
+        if not remaining and not forbidden:
+            return True
+        tail = data[-keep:] if keep else data[:0]
+    return not remaining
+
+def literal_codes(parsed):
+    """Ayrıştırılmış desendeki düz karakter kodlarını, diğer öğeler için None üretir"""
+    for op, arg in parsed:
+        if op is sre_constants.LITERAL:
+            yield arg
+        elif op is sre_constants.SUBPATTERN:
+            yield from literal_codes(arg[-1])
+        elif op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+            yield from literal_codes(arg)
+        else:
+            yield None
+
+def required_literal(pattern):
+    """Desenin her eşleşmesinde bulunması gereken en uzun düz metni döndürür.
+
+    Yalnızca en üst seviyedeki (ve zorunlu gruplardaki) ardışık karakterler
+    dikkate alınır; alternatif, tekrar veya karakter sınıfı diziyi böler.
+    """
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return ''
+    best = current = ''
+    for code in literal_codes(parsed):
+        if code is None:
+            best, current = max(best, current, key=len), ''
+        else:
+            current += chr(code)
+    return max(best, current, key=len)
+
+def glob_to_line_regex(glob):
+    """İçerik araması için glob desenini satır içinde kalan bir düzenli ifadeye çevirir"""
+    parts = []
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        i += 1
+        if char == '*':
+            parts.append('[^\\n]*')
+        elif char == '?':
+            parts.append('[^\\n]')
+        elif char == '[':
+            # '[' veya '[!' ardından gelen ilk ']' sınıfın parçasıdır (fnmatch gibi)
+            end = i + 1 if glob.startswith('!', i) else i
+            if glob.startswith(']', end):
+                end += 1
+            end = glob.find(']', end)
+            if end < 0:
+                parts.append('\\[')  # Kapanmayan sınıf düz karakterdir
+                continue
+            body = glob[i:end].replace('\\', '\\\\').replace('[', '\\[')
+            body = re.sub(r'([&~|])', r'\\\1', body)  # İç içe küme işlemleri sanılmasın
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            elif body.startswith('^'):
+                body = '\\' + body
+            parts.append(f'[{body}]')
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+class QueryMatcher:
+    """Sorguyu arama başında bir kez derler ve adlarla eşleştirir.
+
+    Düz metin kipinde küçük harfli alt dize araması yapılır. Regex ve glob
+    kiplerinde desenden çıkarılan zorunlu alt dize (literal) önce hızlı alt
+    dize kontrolüyle aranır; derlenmiş desen yalnızca bu adaylarda çalışır.
+    Nesne işçi süreçlere gönderilebilir.
+    """
+
+    def __init__(self, query, mode=QUERY_TEXT):
+        if mode not in QUERY_MODES:
+            raise ValueError(f"Bilinmeyen arama kipi: {mode}")
+        self.mode = mode
+        self.query = query.lower()
+        self.name_pattern = None
+        self.content_pattern = None
+        if mode == QUERY_REGEX:
+            self.name_pattern = self.content_pattern = re.compile(query, re.IGNORECASE | re.MULTILINE)
+        elif mode == QUERY_GLOB:
+            self.name_pattern = re.compile(r'\A' + fnmatch.translate(query), re.IGNORECASE)
+            self.content_pattern = re.compile(glob_to_line_regex(query), re.IGNORECASE | re.MULTILINE)
+        self.literal = self.query if self.name_pattern is None else fold_case(required_literal(self.name_pattern))
+
+    def matches(self, name):
+        """Ad sorguyla eşleşiyorsa True döner"""
+        if self.name_pattern is None:
+            return self.query in name.lower()
+        # re.IGNORECASE İ/ı ve ſ gibi harfleri de eşlediğinden ön eleme katlanmış adla yapılır
+        return self.literal in fold_case(name) and self.name_pattern.search(name) is not None
+
+def parse_size(text):
+    """'>1M', '<=500k' gibi boyut koşulunu (işleç, bayt) olarak çözer"""
+    match = SIZE_FILTER.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Geçersiz boyut: {text}")
+    operator, number, unit = match.groups()
+    return operator or '=', int(float(number) * SIZE_UNITS[unit.lower()])
+
+def size_matches(size, operator, limit):
+    if operator == '>':
+        return size > limit
+    if operator == '>=':
+        return size >= limit
+    if operator == '<':
+        return size < limit
+    if operator == '<=':
+        return size <= limit
+    return size == limit
+
+def query_tokens(query):
+    try:
+        return shlex.split(query)
+    except ValueError:  # Kapanmamış tırnak
+        return query.split()
+
+def is_compound_query(query):
+    """Sorgu AND/NOT, '-' ile dışlama veya alan öneki içeriyorsa True döner"""
+    tokens = query_tokens(query)
+    for token in tokens:
+        if token in ('AND', 'NOT') or token.partition(':')[0].lower() in QUERY_FIELDS and ':' in token:
+            return True
+        if len(tokens) > 1 and token.startswith('-') and len(token) > 1:
+            return True
+    return False
+
+class QueryPlan:
+    """Birleşik sorguyu ucuzdan pahalıya sıralanmış yüklemlere ayırır.
+
+    Terimlerin hepsi sağlanmalıdır (AND yazmak isteğe bağlıdır); NOT veya
+    '-' ile başlayan terimler dışlanır, tırnak içindeki ifadeler tek terimdir.
+    name:, ext:, size: (ör. size:>1M) ve content: alanları desteklenir;
+    alansız terimler adda, içerik araması açıksa içerikte de aranır.
+    Değerlendirme sırası: uzantı, ad, boyut (stat), içerik (dosya okuma).
+    """
+
+    def __init__(self, query, content_search=False):
+        self.content_search = content_search
+        self.exts = None  # İzin verilen uzantılar; None ise hepsi
+        self.not_exts = set()
+        self.name_terms, self.not_name_terms = [], []
+        self.terms, self.not_terms = [], []
+        self.content_terms, self.not_content_terms = [], []
+        self.sizes = []  # [(işleç, bayt, dışlama), ...]
+
+        negate = False
+        for token in query_tokens(query):
+            if token == 'AND':
+                continue
+            if token == 'NOT':
+                negate = True
+                continue
+            if token.startswith('-') and len(token) > 1:
+                negate, token = True, token[1:]
+            field, colon, value = token.partition(':')
+            field = field.lower()
+            if not colon or field not in QUERY_FIELDS:
+                field, value = None, token
+            value = value.lower()
+            if value:
+                self.add_term(field, value, negate)
+            negate = False
+
+        if not (self.exts or self.not_exts or self.name_terms or self.not_name_terms or self.terms or
+                self.not_terms or self.content_terms or self.not_content_terms or self.sizes):
+            raise ValueError("Sorguda aranacak terim yok")
+
+    def add_term(self, field, value, negate):
+        if field == 'ext':
+            exts = parse_extensions(value) or frozenset()
+            if negate:
+                self.not_exts |= exts
+            else:
+                self.exts = exts if self.exts is None else self.exts & exts
+        elif field == 'size':
+            self.sizes.append(parse_size(value) + (negate,))
+        elif field == 'name':
+            (self.not_name_terms if negate else self.name_terms).append(value)
+        elif field == 'content':
+            (self.not_content_terms if negate else self.content_terms).append(value)
+        else:
+            (self.not_terms if negate else self.terms).append(value)
+
+    def key(self):
+        """Ayrıştırılmış sorgunun sonuç önbelleği anahtarı; AND/NOT büyük harfe duyarlı olduğundan metin kullanılmaz"""
+        return (QueryPlan, self.exts, frozenset(self.not_exts), tuple(self.name_terms),
+                tuple(self.not_name_terms), tuple(self.terms), tuple(self.not_terms),
+                tuple(self.content_terms), tuple(self.not_content_terms), tuple(self.sizes))
+
+    def reads_files(self):
+        """Sonuç dosyaların boyutuna veya içeriğine bağlıysa True"""
+        return bool(self.sizes or self.content_terms or self.not_content_terms or
+                    self.content_search and (self.terms or self.not_terms))
+
+    def match_dir(self, name):
+        """Dizin yalnızca ad koşullarıyla eşleşebilir"""
+        if self.exts is not None or self.sizes or self.content_terms:
+            return False
+        lowered = name.lower()
+        return (all(term in lowered for term in self.name_terms + self.terms) and
+                not any(term in lowered for term in self.not_name_terms + self.not_terms))
+
+    def match_file(self, root, name):
+        """Dosyayı metadata yüklemleriyle değerlendirir.
+
+        Eşleşmezse None, aksi halde içerikte aranması gereken (gerekli,
+        yasak) terim demetlerini döndürür; ikisi de boşsa dosya eşleşmiştir.
+        """
+        lowered = name.lower()
+        if self.exts is not None or self.not_exts:
+            ext = file_extension(lowered)
+            if self.exts is not None and ext not in self.exts or ext in self.not_exts:
+                return None
+        for term in self.name_terms:
+            if term not in lowered:
+                return None
+        for term in self.not_name_terms + self.not_terms:
+            if term in lowered:
+                return None
+
+        # Adda bulunmayan alansız terimler içerikte aranır
+        required = [term for term in self.terms if term not in lowered]
+        if required and not self.content_search:
+            return None
+
+        if self.sizes:
+            try:
+                size = os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                return None
+            for operator, limit, negate in self.sizes:
+                if size_matches(size, operator, limit) == negate:
+                    return None
+
+        forbidden = self.not_terms if self.content_search else []
+        return tuple(required + self.content_terms), tuple(forbidden + self.not_content_terms)
 
 class AboutDialog(QDialog):
     def __init__(self, parent=None):
@@ -271,6 +2918,85 @@ class AboutDialog(QDialog):
             }
         """)
 
+class ResultListModel(QAbstractListModel):
+    """Arama sonuçlarını QListView için sunan sanal liste modeli.
+
+    Sonuçlar ResultList içinde (dizin numarası, ad, is_dir) olarak tutulur;
+    tam yol yalnızca görünen satırlar için kurulur. Filtre, görünür
+    satırlardan sonuç numaralarına bir eşleme dizisi olarak uygulanır.
+    """
+    FILTER_ALL, FILTER_DIRS, FILTER_FILES = range(3)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = ResultList()
+        self.filter_mode = self.FILTER_ALL
+        self.rows = None  # Filtre varken görünür satır -> sonuç numarası
+        self.folder_icon = QIcon.fromTheme("folder")
+        self.file_icon = QIcon.fromTheme("text-x-generic")
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.results) if self.rows is None else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = index.row() if self.rows is None else self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self.results.path(item)
+        if role == Qt.DecorationRole:
+            return self.folder_icon if self.results.is_dir[item] else self.file_icon
+        if role == Qt.UserRole:
+            return bool(self.results.is_dir[item])
+        return None
+
+    def accepts(self, is_dir):
+        if self.filter_mode == self.FILTER_DIRS:
+            return is_dir
+        if self.filter_mode == self.FILTER_FILES:
+            return not is_dir
+        return True
+
+    def clear(self):
+        self.beginResetModel()
+        self.results = ResultList()  # Daraltmada kullanılan önceki liste değişmeden kalır
+        self.rows = None if self.filter_mode == self.FILTER_ALL else array('I')
+        self.endResetModel()
+
+    def append_results(self, results):
+        """[(path, is_dir), ...] sonuçlarını ekler, yalnızca görünür olanlar için satır açar"""
+        if not results:
+            return
+        start = len(self.results)
+        for path, is_dir in results:
+            self.results.append(path, is_dir)
+
+        if self.rows is None:
+            self.beginInsertRows(QModelIndex(), start, len(self.results) - 1)
+            self.endInsertRows()
+            return
+
+        is_dir = self.results.is_dir
+        visible = [item for item in range(start, len(self.results)) if self.accepts(is_dir[item])]
+        if visible:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(visible) - 1)
+            self.rows.extend(visible)
+            self.endInsertRows()
+
+    def set_filter(self, filter_mode):
+        """Filtreyi değiştirir; yalnızca eşleme dizisi yeniden kurulur"""
+        self.beginResetModel()
+        self.filter_mode = filter_mode
+        if filter_mode == self.FILTER_ALL:
+            self.rows = None
+        else:
+            wanted = 1 if filter_mode == self.FILTER_DIRS else 0
+            self.rows = array('I', (item for item, flag in enumerate(self.results.is_dir) if flag == wanted))
+        self.endResetModel()
+
 # FileSearchApp sınıfında güncelleme
 class FileSearchApp(QWidget):
     def __init__(self):
@@ -279,7 +3005,16 @@ class FileSearchApp(QWidget):
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.start_search)
-        self.last_results = set()
+        self.last_search = None  # Son tamamlanan arama: (sorgu, seçenekler, bitiş zamanı)
+        self.search_key = None  # Çalışan aramanın (sorgu, seçenekler) çifti
+        # İçerik aramaları için uygulama boyunca açık kalan işçi süreçleri
+        self.worker_pool = WorkerPool()
+        # Ev dizinindeki değişiklikleri izleyerek dosya adı dizinini güncel tut
+        self.index_watcher = IndexWatcher(get_file_index(HOME_DIR))
+        self.index_watcher.start()
+        # İsteğe bağlı içerik dizini; dizin dosyası varsa önceki oturumda açılmıştır
+        self.content_index = None
+        self.content_indexer = None
         self.initUI()
 
     def initUI(self):
@@ -314,7 +3049,7 @@ class FileSearchApp(QWidget):
             QPushButton:hover {
                 background-color: #3a3a3a;
             }
-            QListWidget {
+            QListView {
                 background-color: #1e1e1e;
                 border: 1px solid #333333;
                 border-radius: 5px;
@@ -355,8 +3090,15 @@ class FileSearchApp(QWidget):
         self.label = QLabel("Aranacak kelimeyi veya dosya adını girin:")
         self.input = QLineEdit()
 
+        # Arama kipi; sıra QUERY_MODES ile aynı
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Metin", "Regex", "Glob"])
+
         self.about_button = QPushButton("Hakkında")
-        self.result_list = QListWidget()
+        self.result_model = ResultListModel()
+        self.result_view = QListView()
+        self.result_view.setModel(self.result_model)
+        self.result_view.setUniformItemSizes(True)  # Satır yüksekliği tek sefer hesaplanır
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -366,20 +3108,32 @@ class FileSearchApp(QWidget):
         # Dosya formatları için ComboBox
         self.format_label = QLabel("Dosya uzantısı seçin:")
         self.format_combo = QComboBox()
-        self.format_combo.addItems([
-            "Dosya Uzantısı Seçin!", "txt", "doc", "docx", "pdf", "rtf", 
+        self.format_combo.addItem("Dosya Uzantısı Seçin!", None)
+        # Uzantı kümeleri; öğe verisi FileSearch'e verilen küme adıdır
+        for set_name, extensions in EXTENSION_SETS.items():
+            self.format_combo.addItem(
+                f"{EXTENSION_SET_LABELS[set_name]} ({', '.join(sorted(extensions))})", set_name)
+        for extension in [
+            "txt", "doc", "docx", "pdf", "rtf", 
             "html", "htm", "xls", "xlsx", "csv", "ods", "json", "xml", 
             "sql", "mdb", "accdb", "py", "js", "php", "java", "c", "cpp", 
             "sh", "bat"
-        ])
+        ]:
+            self.format_combo.addItem(extension, extension)
         self.format_label.hide()
         self.format_combo.hide()
 
         # Checkboxes
         self.root_directory_checkbox = QCheckBox("Bağlı disklerde ara")
         self.content_search_checkbox = QCheckBox("Dosya içeriklerinde ara")
+        self.content_index_checkbox = QCheckBox("İçerik dizini tut (ev dizini)")
+        self.content_index_checkbox.setToolTip(
+            "Ev dizinindeki metin dosyalarının kelimeleri arka planda dizinlenir; "
+            "içerik aramaları yalnızca aday dosyaları okur.")
+        self.content_index_checkbox.setChecked(os.path.exists(ContentIndex(HOME_DIR).index_path))
+        self.content_index_checkbox.hide()
         
-        # Sonuç filtresi için ComboBox ekle (result_list'ten önce)
+        # Sonuç filtresi için ComboBox ekle (result_view'dan önce)
         self.filter_label = QLabel("Sonuç Filtresi:")
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["Tümünü Göster", "Sadece Klasörler", "Sadece Dosyalar"])
@@ -393,6 +3147,7 @@ class FileSearchApp(QWidget):
         # Layout oluşturma
         input_layout = QHBoxLayout()
         input_layout.addWidget(self.input)
+        input_layout.addWidget(self.mode_combo)
 
         input_layout.addWidget(self.about_button)
 
@@ -402,11 +3157,12 @@ class FileSearchApp(QWidget):
         main_layout.addLayout(input_layout)
         main_layout.addWidget(self.root_directory_checkbox)
         main_layout.addWidget(self.content_search_checkbox)
+        main_layout.addWidget(self.content_index_checkbox)
         main_layout.addWidget(self.format_label)
         main_layout.addWidget(self.format_combo)
         main_layout.addWidget(self.progress_bar)
         main_layout.addLayout(filter_layout)  # Filtre combobox'ı ekle
-        main_layout.addWidget(self.result_list)
+        main_layout.addWidget(self.result_view)
 
         
         self.setLayout(main_layout)
@@ -415,7 +3171,9 @@ class FileSearchApp(QWidget):
 
         self.about_button.clicked.connect(self.show_about_dialog)
         self.content_search_checkbox.stateChanged.connect(self.toggle_format_options)
-        self.result_list.itemDoubleClicked.connect(self.open_file_location)
+        self.content_index_checkbox.stateChanged.connect(self.toggle_content_index)
+        self.mode_combo.currentIndexChanged.connect(lambda: self.on_text_changed(self.input.text()))
+        self.result_view.doubleClicked.connect(self.open_file_location)
         self.input.returnPressed.connect(self.start_search)
         
         # textChanged sinyalini bağla
@@ -426,8 +3184,19 @@ class FileSearchApp(QWidget):
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.start_search)
 
-        # Sonuçları saklamak için liste
-        self.all_results = []
+        self.toggle_content_index()
+
+    def closeEvent(self, event):
+        self.index_watcher.stop()
+        self.index_watcher.join(1)
+        if self.search_worker and self.search_worker.isRunning():
+            self.search_worker.stop()
+            self.search_worker.wait()
+        if self.content_indexer is not None:
+            self.content_indexer.stop()
+            self.content_indexer.join(1)
+        self.worker_pool.shutdown(wait=False)
+        super().closeEvent(event)
 
     def show_about_dialog(self):
         about_dialog = AboutDialog(self)
@@ -437,22 +3206,39 @@ class FileSearchApp(QWidget):
         is_content_search = self.content_search_checkbox.isChecked()
         self.format_label.setVisible(is_content_search)
         self.format_combo.setVisible(is_content_search)
+        self.content_index_checkbox.setVisible(is_content_search)
         
         # İçerik araması seçildiğinde varsayılan uzantıyı txt yap
         if is_content_search:
             self.format_combo.setCurrentText("txt")
+            self.worker_pool.warm()
+
+    def toggle_content_index(self):
+        """İçerik dizinleyicisini başlatır; kapatılınca dizini diskten de siler"""
+        if self.content_index_checkbox.isChecked():
+            if self.content_indexer is None:
+                self.content_index = ContentIndex(HOME_DIR)
+                self.content_indexer = ContentIndexer(self.content_index, get_file_index(HOME_DIR))
+                self.content_indexer.start()
+        elif self.content_indexer is not None:
+            self.content_indexer.stop(discard=True)  # Dizin dosyasını iş parçacığı bitince siler
+            self.content_index = self.content_indexer = None
 
     def on_text_changed(self, text):
         if self.search_worker and self.search_worker.isRunning():
             self.search_worker.stop()
         
         if not text.strip():
-            self.result_list.clear()
+            self.result_model.clear()
+            self.last_search = None
 
             self.label.setText("Aranacak kelimeyi veya dosya adını girin:")
             self.label.setStyleSheet("color: #eeeeee;")
             return
-            
+
+        # İşçiler gecikme süresi içinde açılsın; çökmüş havuz burada yenilenir
+        if self.content_search_checkbox.isChecked():
+            self.worker_pool.warm()
         self.search_timer.start(300)
 
     def start_search(self):
@@ -461,21 +3247,47 @@ class FileSearchApp(QWidget):
         if not search_query:
             return
 
-        self.result_list.clear()
+        content_search = self.content_search_checkbox.isChecked()
+        options = (
+            content_search,
+            self.root_directory_checkbox.isChecked(),
+            self.format_combo.currentData() if content_search else None,
+            QUERY_MODES[self.mode_combo.currentIndex()]
+        )
+
+        # Düz metin sorgusu yalnızca uzadıysa ve seçenekler aynıysa önceki
+        # sonuçları daralt; desenlerde uzayan sorgu alt küme garantisi vermez
+        candidates = None
+        if (self.last_search is not None and options[3] == QUERY_TEXT and
+                not is_compound_query(search_query)):
+            last_query, last_options, finished_at = self.last_search
+            if (last_options == options and last_query in search_query.lower() and
+                    time.monotonic() - finished_at < REFINE_MAX_AGE):
+                candidates = self.result_model.results
+        self.last_search = None
+        self.search_key = (search_query.lower(), options)
+
+        self.result_model.clear()
         self.progress_bar.setValue(0)
         self.progress_bar.show()
 
         if self.search_worker and self.search_worker.isRunning():
             self.search_worker.stop()
-            
-        self.search_worker = SearchWorker(
-            search_query,
-            self.content_search_checkbox.isChecked(),
-            self.root_directory_checkbox.isChecked(),
-            self.format_combo.currentText() if self.content_search_checkbox.isChecked() else None
-        )
+
+        try:
+            self.search_worker = SearchWorker(search_query, *options, candidates=candidates,
+                                              pool=self.worker_pool, content_index=self.content_index)
+        except re.error as e:
+            self.progress_bar.hide()
+            self.update_status(f"Geçersiz desen: {e}", "#ff6666")
+            return
+        except ValueError as e:
+            self.progress_bar.hide()
+            self.update_status(f"Geçersiz sorgu: {e}", "#ff6666")
+            return
         
-        self.search_worker.finished.connect(self.handle_search_results)
+        self.search_worker.results_batch.connect(self.handle_results_batch)
+        self.search_worker.finished.connect(self.handle_search_finished)
         self.search_worker.error.connect(self.handle_search_error)
         self.search_worker.progress.connect(self.progress_bar.setValue)
         self.search_worker.status.connect(self.update_status)
@@ -485,30 +3297,19 @@ class FileSearchApp(QWidget):
         self.label.setText(message)
         self.label.setStyleSheet(f"color: {color};")
 
-    def handle_search_results(self, results):
-        self.all_results = results  # Tüm sonuçları sakla
-        self.filter_results()  # Filtreyi uygula
-        self.progress_bar.hide()
+    def handle_results_batch(self, results):
+        # Önceki aramadan kuyrukta kalan sonuçları yok say
+        if self.sender() is not self.search_worker:
+            return
+        self.result_model.append_results(results)
+
+    def handle_search_finished(self, result_count):
+        if self.sender() is self.search_worker:
+            self.progress_bar.hide()
+            self.last_search = self.search_key + (time.monotonic(),)
 
     def filter_results(self):
-        self.result_list.clear()
-        folder_icon = QIcon.fromTheme("folder")
-        file_icon = QIcon.fromTheme("text-x-generic")
-        
-        filter_index = self.filter_combo.currentIndex()
-        
-        for path, is_dir in self.all_results:
-            # Filtre kontrolü
-            if filter_index == 1 and not is_dir:  # Sadece Klasörler
-                continue
-            elif filter_index == 2 and is_dir:  # Sadece Dosyalar
-                continue
-                
-            item = QListWidgetItem()
-            item.setText(path)
-            item.setIcon(folder_icon if is_dir else file_icon)
-            item.setData(Qt.UserRole, is_dir)
-            self.result_list.addItem(item)
+        self.result_model.set_filter(self.filter_combo.currentIndex())
 
     def handle_search_error(self, error_message):
         self.progress_bar.hide()
@@ -516,9 +3317,9 @@ class FileSearchApp(QWidget):
         self.label.setText(f"Bir hata oluştu: {error_message}")
         self.label.setStyleSheet("color: #ff6666;")
 
-    def open_file_location(self, item):
-        path = item.text()
-        is_dir = item.data(Qt.UserRole)
+    def open_file_location(self, index):
+        path = index.data()
+        is_dir = index.data(Qt.UserRole)
         
         if os.path.exists(path):
             if is_dir:
@@ -528,7 +3329,7 @@ class FileSearchApp(QWidget):
                 # Dosya ise içinde bulunduğu dizini aç
                 subprocess.run(['xdg-open', os.path.dirname(path)])
         else:
-            file_path = item.text()
+            file_path = path
             file_dir = os.path.dirname(file_path)
             file_name = os.path.basename(file_path)
             
@@ -577,10 +3378,83 @@ class FileSearchApp(QWidget):
                 QMessageBox.critical(self, "Hata", 
                     f"Dosya yolunu açarken bir hata oluştu:\n{str(e)}")
 
-if __name__ == "__main__":
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='searcher',
+        description='Dosya adlarında ve içeriklerinde arama yapar; argümansız çalıştırılırsa arayüzü açar.')
+    parser.add_argument('query', metavar='QUERY', help='aranacak kelime veya dosya adı')
+    parser.add_argument('paths', metavar='PATH', nargs='*',
+                        help='aranacak dizinler (varsayılan: ev dizini)')
+    parser.add_argument('--content', action='store_true', help='dosya içeriklerinde de ara')
+    parser.add_argument('--ext', metavar='EXT', action='append',
+                        help='yalnızca bu uzantılardaki dosyalar: py, py,js veya küme adı (' +
+                             ', '.join(EXTENSION_SETS) + '); tekrarlanabilir')
+    parser.add_argument('--mounts', action='store_true', help='bağlı disklerde ara')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('-E', '--regex', dest='mode', action='store_const', const=QUERY_REGEX,
+                      default=QUERY_TEXT, help='sorguyu düzenli ifade olarak yorumla')
+    mode.add_argument('-g', '--glob', dest='mode', action='store_const', const=QUERY_GLOB,
+                      help='sorguyu kabuk deseni olarak yorumla (ör. "*.py")')
+    parser.add_argument('-0', '--null', action='store_true',
+                        help='sonuçları satır sonu yerine NUL ile ayır (xargs -0 için)')
+    return parser.parse_intermixed_args(argv)
+
+def run_cli(argv):
+    """Komut satırı araması: sonuçları bulundukça stdout'a yazar.
+
+    Çıkış kodu grep gibidir: sonuç varsa 0, yoksa 1, hata durumunda 2.
+    """
+    args = parse_args(argv)
+    search_paths = [os.path.abspath(path) for path in args.paths]
+    for path in search_paths:
+        if not os.path.isdir(path):
+            print(f"searcher: dizin bulunamadı: {path}", file=sys.stderr)
+            return 2
+    if args.mounts:
+        search_paths += get_mounted_paths()
+        if not search_paths:
+            print("searcher: bağlı disk bulunamadı", file=sys.stderr)
+            return 2
+
+    try:
+        search = FileSearch(args.query, args.content, search_paths, ','.join(args.ext or ()),
+                            query_mode=args.mode)
+    except re.error as e:
+        print(f"searcher: geçersiz desen: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"searcher: geçersiz sorgu: {e}", file=sys.stderr)
+        return 2
+    separator = '\0' if args.null else '\n'
+    batches = search.batches()
+    try:
+        for results in batches:
+            sys.stdout.write(''.join(path + separator for path, _ in results))
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Okuyan taraf kapandı (ör. head); çıkışta stdout tekrar boşaltılırken hata verilmesin
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        search.stop()
+        batches.close()  # Bekleyen içerik gruplarını iptal et
+    return 0 if search.result_count else 1
+
+def main(argv=None):
+    """Argüman verilirse komut satırı aramasını, verilmezse arayüzü başlatır"""
+    multiprocessing.freeze_support()  # PyInstaller ile derlenmiş sürümde işçi süreçleri için
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return run_cli(argv)
+
     app = QApplication(sys.argv)
     if ICON_PATH:
         app.setWindowIcon(QIcon(ICON_PATH))
     window = FileSearchApp()
     window.show()
-    sys.exit(app.exec_())
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(main())